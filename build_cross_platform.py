@@ -36,6 +36,11 @@ def build_for_platform(platform_name, spec_file):
     if os.path.exists("build"):
         run_command("rm -rf build", f"Cleaning {platform_name} build artifacts")
     
+    # Precompile the chord assignment kernel so the app doesn't JIT it on
+    # first use; the app falls back to NumPy/JIT if this step fails
+    run_command(f"{sys.executable} -m song_editor.core._chord_assign_aot",
+                "Precompiling chord assignment kernel")
+    
     # Build the executable
     if run_command(f"pyinstaller {spec_file}", f"Building {platform_name} executable"):
         print(f"✅ {platform_name} build completed successfully!")
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the chord assignment kernel.
+
+Run ``python -m song_editor.core._chord_assign_aot`` to compile the sweep
+from chord_assign into a ``chord_assign_aot`` extension module next to this
+file. chord_assign prefers it when present, which avoids the Numba JIT
+compile on the first song processed after launch.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .chord_assign import assign_chords_sweep_py
+
+cc = CC('chord_assign_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('assign_chords', 'i8[:](f8[:], f8[:], f8[:], f8[:])')(assign_chords_sweep_py)
+
+
+if __name__ == "__main__":
+    cc.compile()
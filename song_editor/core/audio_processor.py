@@ -303,6 +303,10 @@ class AudioProcessor:
         
         return temp_path
     
+    def save_temp_audio(self, audio: np.ndarray, sr: int) -> str:
+        """Save processed audio to a temporary WAV file; the caller deletes it."""
+        return self._save_audio_temp(audio, sr)
+    
     def _save_intermediate_files(self, audio: np.ndarray, sr: int, stage: str):
         """Save intermediate audio files if requested."""
         if not self.save_intermediate:
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Chord Assignment Module
+
+Finds the chord playing under each word for Song Editor 3.
+
+Chords are detected as disjoint time spans, so the only chord that can
+contain a word's midpoint is the last one starting at or before it, or the
+one before that when the two share an endpoint. Every implementation here
+takes the word and chord time columns, with the chords sorted by start and
+of positive length, and returns per word the index of the best containing
+chord by overlap (earlier chord on ties), or -1 for none.
+"""
+
+import numpy as np
+
+# Optional imports
+try:
+    # Built ahead of time by song_editor.core._chord_assign_aot
+    from .chord_assign_aot import assign_chords as _assign_chords_aot
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Below this size the vectorized lookup is already fast and the JIT sweep
+# isn't worth compiling on first use
+NUMBA_MIN_WORDS = 10000
+
+
+def assign_chords_vectorized(ws, we, cs, ce):
+    """Binary-search chord lookup, O((W + C) log C)."""
+    mid = (ws + we) / 2.0
+    last = np.searchsorted(cs, mid, side='right') - 1
+    
+    def containing_overlap(idx):
+        """Overlap with chord ``idx`` per word, 0 where it doesn't hold the midpoint."""
+        valid = idx >= 0
+        safe = np.where(valid, idx, 0)
+        overlap = np.minimum(we, ce[safe]) - np.maximum(ws, cs[safe])
+        return np.where(valid & (mid <= ce[safe]), overlap, 0.0)
+    
+    overlap_last = containing_overlap(last)
+    overlap_prev = containing_overlap(last - 1)
+    use_prev = overlap_prev >= overlap_last
+    best = np.where(use_prev, last - 1, last)
+    best_overlap = np.where(use_prev, overlap_prev, overlap_last)
+    return np.where(best_overlap > 0.0, best, -1)
+
+
+def assign_chords_sweep_py(ws, we, cs, ce):
+    """Single sweep over words in time order; plain Python source of the compiled kernels."""
+    n_words = ws.shape[0]
+    n_chords = cs.shape[0]
+    best = np.full(n_words, -1, np.int64)
+    mid = (ws + we) / 2.0
+    order = np.argsort(mid)
+    j = -1
+    for k in range(n_words):
+        i = order[k]
+        while j + 1 < n_chords and cs[j + 1] <= mid[i]:
+            j += 1
+        best_overlap = 0.0
+        # Earlier chord first so it keeps ties
+        for c in range(j - 1, j + 1):
+            if c >= 0 and mid[i] <= ce[c]:
+                overlap = min(we[i], ce[c]) - max(ws[i], cs[c])
+                if overlap > best_overlap:
+                    best_overlap = overlap
+                    best[i] = c
+    return best
+
+
+if NUMBA_AVAILABLE:
+    assign_chords_sweep = njit(cache=True, nogil=True)(assign_chords_sweep_py)
+else:
+    assign_chords_sweep = None
+
+
+def assign_chords(ws: np.ndarray, we: np.ndarray, cs: np.ndarray, ce: np.ndarray) -> np.ndarray:
+    """Pick the fastest available implementation for the input size."""
+    if AOT_AVAILABLE:
+        # Precompiled, so there is no first-call compile to amortize
+        return _assign_chords_aot(ws, we, cs, ce)
+    if NUMBA_AVAILABLE and ws.shape[0] >= NUMBA_MIN_WORDS:
+        return assign_chords_sweep(ws, we, cs, ce)
+    return assign_chords_vectorized(ws, we, cs, ce)
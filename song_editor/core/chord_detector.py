@@ -88,11 +88,11 @@ class ChordDetector:
             logging.error(f"Error saving temporary audio file: {e}")
             raise
     
-    def _detect_chords_chordino(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
+    def _detect_chords_chordino(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Detect chords using Chordino."""
         try:
-            # Save audio to temporary file
-            temp_path = self._save_audio_temp(audio, sample_rate)
+            # Save audio to temporary file unless the caller already wrote one
+            temp_path = audio_path or self._save_audio_temp(audio, sample_rate)
             
             try:
                 # Extract chords using chord_extractor
@@ -129,7 +129,7 @@ class ChordDetector:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_path):
+                if temp_path != audio_path and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     
         except Exception as e:
@@ -377,15 +377,19 @@ class ChordDetector:
         
         return merged_chords
     
-    def detect(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
-        """Detect chords in audio using the selected method."""
+    def detect(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Detect chords in audio using the selected method.
+        
+        ``audio_path`` may name a WAV file already holding ``audio``; backends
+        that read from disk use it instead of writing their own copy.
+        """
         start_time = datetime.now()
         
         try:
             logging.info("Starting chord detection...")
             
             if self.use_chordino:
-                chords = self._detect_chords_chordino(audio, sample_rate)
+                chords = self._detect_chords_chordino(audio, sample_rate, audio_path)
                 logging.info(f"Chordino detected {len(chords)} chords")
             else:
                 chords = self._detect_chords_chromagram(audio, sample_rate)
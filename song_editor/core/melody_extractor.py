@@ -65,11 +65,11 @@ class MelodyExtractor:
             logging.error(f"Error saving temporary audio file: {e}")
             raise
     
-    def _extract_melody_basic_pitch(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
+    def _extract_melody_basic_pitch(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Extract melody using Basic Pitch."""
         try:
-            # Save audio to temporary file
-            temp_path = self._save_audio_temp(audio, sample_rate)
+            # Save audio to temporary file unless the caller already wrote one
+            temp_path = audio_path or self._save_audio_temp(audio, sample_rate)
             
             try:
                 # Run Basic Pitch inference
@@ -110,7 +110,7 @@ class MelodyExtractor:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_path):
+                if temp_path != audio_path and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     
         except Exception as e:
@@ -321,15 +321,19 @@ class MelodyExtractor:
                 'melodic_direction': 'stable'
             }
     
-    def extract(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
-        """Extract melody from audio using the selected method."""
+    def extract(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Extract melody from audio using the selected method.
+        
+        ``audio_path`` may name a WAV file already holding ``audio``; backends
+        that read from disk use it instead of writing their own copy.
+        """
         start_time = datetime.now()
         
         try:
             logging.info("Starting melody extraction...")
             
             if self.use_basic_pitch:
-                notes = self._extract_melody_basic_pitch(audio, sample_rate)
+                notes = self._extract_melody_basic_pitch(audio, sample_rate, audio_path)
                 logging.info(f"Basic Pitch extracted {len(notes)} notes")
             else:
                 notes = self._extract_melody_crepe(audio, sample_rate)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Note Merge Module
+
+Finds runs of notes to merge for Song Editor 3.
+
+A note joins the run before it when it has the same pitch and starts within
+a small gap of the previous note's end. Every implementation here takes the
+pitch and timing columns of the notes in list order and returns the index of
+the first and last note of each run.
+"""
+
+import numpy as np
+
+# Optional imports
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Below this size the vectorized pass is already fast and the JIT sweep
+# isn't worth compiling on first use
+NUMBA_MIN_NOTES = 10000
+
+
+def merge_runs_vectorized(pitches, starts, ends, gap_tol):
+    """Run boundaries from one comparison over neighbouring notes."""
+    same = (pitches[:-1] == pitches[1:]) & (np.abs(ends[:-1] - starts[1:]) < gap_tol)
+    firsts = np.flatnonzero(np.concatenate((np.ones(1, np.bool_), ~same)))
+    lasts = np.append(firsts[1:] - 1, pitches.shape[0] - 1)
+    return firsts, lasts
+
+
+def merge_runs_sweep_py(pitches, starts, ends, gap_tol):
+    """Single sweep over the notes; plain Python source of the compiled kernel."""
+    n = pitches.shape[0]
+    firsts = np.empty(n, np.int64)
+    lasts = np.empty(n, np.int64)
+    k = 0
+    firsts[0] = 0
+    for i in range(1, n):
+        if pitches[i] == pitches[i - 1] and abs(ends[i - 1] - starts[i]) < gap_tol:
+            continue
+        lasts[k] = i - 1
+        k += 1
+        firsts[k] = i
+    lasts[k] = n - 1
+    return firsts[:k + 1], lasts[:k + 1]
+
+
+if NUMBA_AVAILABLE:
+    merge_runs_sweep = njit(cache=True, nogil=True)(merge_runs_sweep_py)
+else:
+    merge_runs_sweep = None
+
+
+def merge_runs(pitches: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+               gap_tol: float):
+    """Pick the fastest available implementation for the input size."""
+    if pitches.shape[0] == 0:
+        empty = np.empty(0, np.int64)
+        return empty, empty
+    if NUMBA_AVAILABLE and pitches.shape[0] >= NUMBA_MIN_NOTES:
+        return merge_runs_sweep(pitches, starts, ends, gap_tol)
+    return merge_runs_vectorized(pitches, starts, ends, gap_tol)
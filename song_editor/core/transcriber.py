@@ -31,6 +31,13 @@ except ImportError:
     FASTER_WHISPER_AVAILABLE = False
     logging.warning("Faster Whisper not available")
 
+try:
+    # Added in faster-whisper 1.1
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_WHISPER_AVAILABLE = True
+except ImportError:
+    BATCHED_WHISPER_AVAILABLE = False
+
 try:
     import whisperx
     WHISPERX_AVAILABLE = True
@@ -57,7 +64,9 @@ class Transcriber:
         confidence_threshold: float = 0.5,
         language: Optional[str] = None,
         prompt: Optional[str] = None,
-        content_type: str = "general"
+        content_type: str = "general",
+        compute_type: str = "float32",
+        batch_size: int = 1
     ):
         self.model = model
         self.model_size = model_size
@@ -66,6 +75,9 @@ class Transcriber:
         self.language = language
         self.prompt = prompt
         self.content_type = content_type
+        # Faster Whisper only: CTranslate2 precision and batched inference size
+        self.compute_type = compute_type
+        self.batch_size = batch_size
         
         # Set default prompts based on content type
         if self.prompt is None:
@@ -73,6 +85,7 @@ class Transcriber:
         
         # Initialize model based on type
         self.whisper_model = None
+        self._batched_pipeline = None
         self._initialize_model()
     
     def _initialize_model(self) -> None:
@@ -85,9 +98,9 @@ class Transcriber:
                 self.whisper_model = whisper.load_model(model_size)
                 
             elif self.model == "faster-whisper" and FASTER_WHISPER_AVAILABLE:
-                logging.info(f"Loading Faster Whisper model: {self.model_size} with GPU acceleration")
-                # Use GPU acceleration with auto device selection and float32 compute type
-                self.whisper_model = WhisperModel(self.model_size, device='auto', compute_type='float32')
+                logging.info(f"Loading Faster Whisper model: {self.model_size} ({self.compute_type}) with GPU acceleration")
+                # Use GPU acceleration with auto device selection
+                self.whisper_model = WhisperModel(self.model_size, device='auto', compute_type=self.compute_type)
                 
             elif self.model == "whisperx" and WHISPERX_AVAILABLE:
                 logging.info(f"Loading WhisperX model: {self.model_size}")
@@ -103,7 +116,7 @@ class Transcriber:
                 if FASTER_WHISPER_AVAILABLE:
                     logging.warning(f"Model {self.model} not available, falling back to faster-whisper with GPU acceleration")
                     self.model = "faster-whisper"
-                    self.whisper_model = WhisperModel(self.model_size, device='auto', compute_type='float32')
+                    self.whisper_model = WhisperModel(self.model_size, device='auto', compute_type=self.compute_type)
                 else:
                     raise ValueError(f"Model {self.model} not available and no fallback found")
                     
@@ -137,11 +150,11 @@ class Transcriber:
             logging.error(f"Error saving temporary audio file: {e}")
             raise
     
-    def _transcribe_openai_whisper(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
+    def _transcribe_openai_whisper(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Transcribe using OpenAI Whisper."""
         try:
-            # Save audio to temporary file
-            temp_path = self._save_audio_temp(audio, sample_rate)
+            # Save audio to temporary file unless the caller already wrote one
+            temp_path = audio_path or self._save_audio_temp(audio, sample_rate)
             
             try:
                 # Transcribe with OpenAI Whisper - use exact working parameters from wav_to_karoke
@@ -175,28 +188,36 @@ class Transcriber:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_path):
+                if temp_path != audio_path and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     
         except Exception as e:
             logging.error(f"Error in OpenAI Whisper transcription: {e}")
             raise
     
-    def _transcribe_faster_whisper(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
+    def _transcribe_faster_whisper(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Transcribe using Faster Whisper."""
         try:
-            # Save audio to temporary file
-            temp_path = self._save_audio_temp(audio, sample_rate)
+            # Save audio to temporary file unless the caller already wrote one
+            temp_path = audio_path or self._save_audio_temp(audio, sample_rate)
             
             try:
                 # Transcribe with Faster Whisper - use working parameters from wav_to_karoke
-                segments, info = self.whisper_model.transcribe(
-                    temp_path,
+                options = dict(
                     language=self.language if self.language else None,
                     word_timestamps=True,  # Re-enable word timestamps (they work fine)
                     beam_size=1,  # Keep beam size at 1
                     initial_prompt=self.prompt if self.prompt else None
                 )
+                if self.batch_size > 1 and BATCHED_WHISPER_AVAILABLE:
+                    # Decode several VAD-split chunks of the song per forward pass
+                    if self._batched_pipeline is None:
+                        self._batched_pipeline = BatchedInferencePipeline(model=self.whisper_model)
+                    segments, info = self._batched_pipeline.transcribe(
+                        temp_path, batch_size=self.batch_size, **options
+                    )
+                else:
+                    segments, info = self.whisper_model.transcribe(temp_path, **options)
                 
                 # Process results
                 words = []
@@ -218,18 +239,18 @@ class Transcriber:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_path):
+                if temp_path != audio_path and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     
         except Exception as e:
             logging.error(f"Error in Faster Whisper transcription: {e}")
             raise
     
-    def _transcribe_whisperx(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
+    def _transcribe_whisperx(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Transcribe using WhisperX."""
         try:
-            # Save audio to temporary file
-            temp_path = self._save_audio_temp(audio, sample_rate)
+            # Save audio to temporary file unless the caller already wrote one
+            temp_path = audio_path or self._save_audio_temp(audio, sample_rate)
             
             try:
                 # Load WhisperX model
@@ -275,18 +296,18 @@ class Transcriber:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_path):
+                if temp_path != audio_path and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     
         except Exception as e:
             logging.error(f"Error in WhisperX transcription: {e}")
             raise
     
-    def _transcribe_mlx_whisper(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
+    def _transcribe_mlx_whisper(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Transcribe using MLX Whisper."""
         try:
-            # Save audio to temporary file
-            temp_path = self._save_audio_temp(audio, sample_rate)
+            # Save audio to temporary file unless the caller already wrote one
+            temp_path = audio_path or self._save_audio_temp(audio, sample_rate)
             
             try:
                 # Transcribe with MLX Whisper
@@ -318,7 +339,7 @@ class Transcriber:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_path):
+                if temp_path != audio_path and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     
         except Exception as e:
@@ -354,8 +375,12 @@ class Transcriber:
         
         return alternatives
     
-    def transcribe(self, audio: np.ndarray, sample_rate: int) -> List[Dict[str, Any]]:
-        """Transcribe audio using the selected Whisper model."""
+    def transcribe(self, audio: np.ndarray, sample_rate: int, audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Transcribe audio using the selected Whisper model.
+        
+        ``audio_path`` may name a WAV file already holding ``audio``; backends
+        that read from disk use it instead of writing their own copy.
+        """
         start_time = datetime.now()
         
         try:
@@ -379,13 +404,13 @@ class Transcriber:
                     logging.info(f"Trying transcription with {model_name}...")
                     
                     if model_name == "openai-whisper":
-                        words = self._transcribe_openai_whisper(audio, sample_rate)
+                        words = self._transcribe_openai_whisper(audio, sample_rate, audio_path)
                     elif model_name == "faster-whisper":
-                        words = self._transcribe_faster_whisper(audio, sample_rate)
+                        words = self._transcribe_faster_whisper(audio, sample_rate, audio_path)
                     elif model_name == "whisperx":
-                        words = self._transcribe_whisperx(audio, sample_rate)
+                        words = self._transcribe_whisperx(audio, sample_rate, audio_path)
                     elif model_name == "mlx-whisper":
-                        words = self._transcribe_mlx_whisper(audio, sample_rate)
+                        words = self._transcribe_mlx_whisper(audio, sample_rate, audio_path)
                     
                     if words is not None:
                         logging.info(f"Successfully transcribed with {model_name}")
@@ -429,6 +454,9 @@ class Transcriber:
             'language': self.language,
             'content_type': self.content_type,
             'prompt': self.prompt,
+            'compute_type': self.compute_type,
+            # Sequential without the batched pipeline, whatever was asked for
+            'batch_size': self.batch_size if BATCHED_WHISPER_AVAILABLE else 1,
             'available_models': {
                 'openai-whisper': OPENAI_WHISPER_AVAILABLE,
                 'faster-whisper': FASTER_WHISPER_AVAILABLE,
@@ -441,6 +469,7 @@ class Transcriber:
         """Clean up resources."""
         try:
             # Clear model from memory
+            self._batched_pipeline = None
             if self.whisper_model is not None:
                 del self.whisper_model
                 self.whisper_model = None
@@ -12,6 +12,13 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+# Optional imports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class JSONExporter:
     """Handles export of song data to enhanced JSON format."""
@@ -72,10 +79,9 @@ class JSONExporter:
                     logging.error(f"Word {i} has invalid timing: start ({start}) > end ({end})")
                     return False
                 elif start == end:
-                    # Allow identical start/end times but warn about it
+                    # Allow identical start/end times but warn about it;
+                    # _clean_word_data gives the exported copy a small duration
                     logging.warning(f"Word {i} has identical start/end timing: ({start})")
-                    # Fix by adding small duration if end time is exactly equal to start
-                    word['end'] = start + 0.01
             
             return True
             
@@ -92,6 +98,11 @@ class JSONExporter:
             'confidence': float(word.get('confidence', 0.0))
         }
         
+        # Fix by adding small duration if end time is exactly equal to start.
+        # Done on the copy, since the caller's dict may be shared
+        if self.validate_schema and cleaned_word['end'] == cleaned_word['start']:
+            cleaned_word['end'] = cleaned_word['start'] + 0.01
+        
         # Add alternatives if available and requested
         if self.include_alternatives and 'alternatives' in word:
             alternatives = word.get('alternatives', [])
@@ -239,6 +250,63 @@ class JSONExporter:
             'validate_schema': self.validate_schema
         }
     
+    def _write_json(self, data: Dict[str, Any], output_path: str) -> None:
+        """Write data as UTF-8 JSON, using orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            try:
+                self._stream_orjson(data, output_path)
+                return
+            except orjson.JSONEncodeError as e:
+                # e.g. integers beyond 64 bits; the json module copes (and
+                # overwrites the partial file)
+                logging.debug(f"orjson could not encode song data, using json: {e}")
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if self.pretty_print:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            else:
+                json.dump(data, f, ensure_ascii=False, default=str)
+    
+    def _stream_orjson(self, data: Dict[str, Any], output_path: str) -> None:
+        """Write data with orjson one top-level list item at a time.
+        
+        Only a single word/chord/note is encoded in memory at once instead of
+        the whole document. The output matches json.dump(indent=2) layout.
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.pretty_print:
+            option |= orjson.OPT_INDENT_2
+            # JSON strings never contain raw newlines, so this only re-indents
+            newline, key_sep = b'\n', b': '
+        else:
+            newline, key_sep = b'', b':'
+        
+        def dumps(value, depth: int) -> bytes:
+            encoded = orjson.dumps(value, default=str, option=option)
+            return encoded.replace(b'\n', b'\n' + b'  ' * depth) if newline else encoded
+        
+        with open(output_path, 'wb') as f:
+            if not data:
+                f.write(b'{}')
+                return
+            f.write(b'{')
+            for i, (key, value) in enumerate(data.items()):
+                if i:
+                    f.write(b',')
+                f.write(newline + b'  ' if newline else b'')
+                f.write(orjson.dumps(str(key)) + key_sep)
+                if isinstance(value, list) and value:
+                    f.write(b'[')
+                    for j, item in enumerate(value):
+                        if j:
+                            f.write(b',')
+                        f.write(newline + b'    ' if newline else b'')
+                        f.write(dumps(item, 2))
+                    f.write(newline + b'  ]' if newline else b']')
+                else:
+                    f.write(dumps(value, 1))
+            f.write(newline + b'}')
+    
     def export(self, song_data: Dict[str, Any], output_path: str) -> bool:
         """Export song data to JSON file."""
         try:
@@ -257,11 +325,7 @@ class JSONExporter:
             self._add_export_metadata(export_data, output_path)
             
             # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if self.pretty_print:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False, default=str)
+            self._write_json(export_data, output_path)
             
             # Log export statistics
             word_count = len(export_data.get('words', []))
@@ -313,11 +377,7 @@ class JSONExporter:
             self._add_export_metadata(minimal_data, output_path)
             
             # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if self.pretty_print:
-                    json.dump(minimal_data, f, indent=2, ensure_ascii=False, default=str)
-                else:
-                    json.dump(minimal_data, f, ensure_ascii=False, default=str)
+            self._write_json(minimal_data, output_path)
             
             logging.info(f"Minimal JSON exported successfully")
             return True
@@ -366,11 +426,7 @@ class JSONExporter:
             self._add_export_metadata(analysis_data, output_path)
             
             # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if self.pretty_print:
-                    json.dump(analysis_data, f, indent=2, ensure_ascii=False, default=str)
-                else:
-                    json.dump(analysis_data, f, ensure_ascii=False, default=str)
+            self._write_json(analysis_data, output_path)
             
             logging.info(f"Analysis-only JSON exported successfully")
             return True
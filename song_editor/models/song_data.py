@@ -5,13 +5,19 @@ Song Data Models
 Defines the core data structures for Song Editor 3.
 """
 
+import copy
+import sys
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
 
+# Songs hold thousands of words and notes, so give them __slots__ where the
+# running Python supports slotted dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Word:
     """Represents a single word with timing and confidence."""
     text: str
@@ -51,7 +57,7 @@ class Word:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Chord:
     """Represents a chord with timing and properties."""
     symbol: str
@@ -104,7 +110,7 @@ class Chord:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Note:
     """Represents a musical note with timing and properties."""
     pitch_midi: int
@@ -163,6 +169,10 @@ class SongData:
     words: List[Word] = field(default_factory=list)
     chords: List[Chord] = field(default_factory=list)
     notes: List[Note] = field(default_factory=list)
+    # Bumped by mark_dirty(); to_dict_cached() rebuilds when it moves
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache_version: int = field(default=-1, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -174,14 +184,29 @@ class SongData:
         }
         return result
     
+    def mark_dirty(self) -> None:
+        """Record that the song changed, invalidating to_dict_cached()."""
+        self._version += 1
+    
+    def to_dict_cached(self) -> Dict[str, Any]:
+        """Like to_dict(), but reuse the last result until mark_dirty() is called.
+        
+        The returned dict is shared between callers and must not be modified.
+        """
+        if self._dict_cache is None or self._dict_cache_version != self._version:
+            self._dict_cache = self.to_dict()
+            self._dict_cache_version = self._version
+        return self._dict_cache
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SongData':
         """Create from dictionary representation."""
         return cls(
-            metadata=data.get('metadata', {}),
-            words=[Word.from_dict(w) for w in data.get('words', [])],
-            chords=[Chord.from_dict(c) for c in data.get('chords', [])],
-            notes=[Note.from_dict(n) for n in data.get('notes', [])]
+            # Deep copy: callers may pass a shared dict (e.g. a cached file)
+            metadata=copy.deepcopy(data.get('metadata', {})),
+            words=list(map(Word.from_dict, data.get('words', []))),
+            chords=list(map(Chord.from_dict, data.get('chords', []))),
+            notes=list(map(Note.from_dict, data.get('notes', [])))
         )
     
     def get_duration(self) -> float:
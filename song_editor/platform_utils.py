@@ -9,7 +9,9 @@ for cross-platform compatibility across macOS, iOS, Windows, and Android.
 import sys
 import os
 import platform
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from enum import Enum
 
 
@@ -24,9 +26,14 @@ class Platform(Enum):
 
 
 class PlatformUtils:
-    """Platform detection and configuration utilities."""
+    """Platform detection and configuration utilities.
+    
+    The platform can't change while the app runs, so detection and the
+    platform config are computed once and cached.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def detect_platform() -> Platform:
         """Detect the current platform."""
         system = platform.system().lower()
@@ -55,8 +62,9 @@ class PlatformUtils:
         return Platform.UNKNOWN
     
     @staticmethod
-    def get_platform_config() -> Dict[str, Any]:
-        """Get platform-specific configuration."""
+    @lru_cache(maxsize=1)
+    def get_platform_config() -> Mapping[str, Any]:
+        """Get platform-specific configuration (read-only, shared by all callers)."""
         platform_type = PlatformUtils.detect_platform()
         
         configs = {
@@ -151,9 +159,10 @@ class PlatformUtils:
             }
         }
         
-        return configs.get(platform_type, configs[Platform.LINUX])
+        return MappingProxyType(configs.get(platform_type, configs[Platform.LINUX]))
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_mobile() -> bool:
         """Check if running on a mobile platform."""
         platform_type = PlatformUtils.detect_platform()
@@ -172,6 +181,7 @@ class PlatformUtils:
         return config.get("touch_support", False)
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_high_dpi() -> bool:
         """Check if high DPI display is supported."""
         config = PlatformUtils.get_platform_config()
@@ -239,35 +239,25 @@ class ChordEditor(QWidget):
         self.chord_table.blockSignals(True)
         self.chord_table.setRowCount(len(self.chords))
         
+        # Rows that already have items are updated in place rather than
+        # getting freshly allocated ones
         for row, chord in enumerate(self.chords):
-            # Symbol
-            symbol_item = QTableWidgetItem(chord.symbol)
-            self.chord_table.setItem(row, 0, symbol_item)
-            
-            # Root
-            root_item = QTableWidgetItem(chord.root)
-            self.chord_table.setItem(row, 1, root_item)
-            
-            # Quality
-            quality_item = QTableWidgetItem(chord.quality)
-            self.chord_table.setItem(row, 2, quality_item)
-            
-            # Start time
-            start_item = QTableWidgetItem(f"{chord.start:.3f}")
-            self.chord_table.setItem(row, 3, start_item)
-            
-            # End time
-            end_item = QTableWidgetItem(f"{chord.end:.3f}")
-            self.chord_table.setItem(row, 4, end_item)
-            
-            # Duration
             duration = chord.end - chord.start
-            duration_item = QTableWidgetItem(f"{duration:.3f}")
-            self.chord_table.setItem(row, 5, duration_item)
-            
-            # Detection method
-            method_item = QTableWidgetItem(chord.detection_method or "")
-            self.chord_table.setItem(row, 6, method_item)
+            texts = (
+                chord.symbol,
+                chord.root,
+                chord.quality,
+                f"{chord.start:.3f}",
+                f"{chord.end:.3f}",
+                f"{duration:.3f}",
+                chord.detection_method or ""
+            )
+            for col, text in enumerate(texts):
+                item = self.chord_table.item(row, col)
+                if item is None:
+                    self.chord_table.setItem(row, col, QTableWidgetItem(text))
+                else:
+                    item.setText(text)
         
         self.chord_table.blockSignals(False)
     
@@ -1,5 +1,9 @@
 import os
+import logging
+import queue
 import re
+import string
+import threading
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
@@ -11,7 +15,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QThread, QTimer
 from PySide6.QtGui import (
     QTextCursor, QTextCharFormat, QColor, QFont, QPalette,
-    QTextDocument, QTextBlockFormat, QTextBlock, QTextOption
+    QTextBlockFormat, QTextBlock, QTextOption
 )
 
 import cmudict
@@ -19,10 +23,86 @@ import pronouncing
 import nltk
 from collections import Counter
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from ..models.lyrics import WordRow
 from ..core.audio_player import AudioPlayer
 
 
+# Translation table that strips every ASCII character except letters and
+# apostrophes, so contractions like "don't" stay a single word
+_KEEP_CHARS = set(string.ascii_letters + "'")
+_DELETE_TBL = {i: None for i in range(128) if chr(i) not in _KEEP_CHARS}
+
+
+def _clean_word(word: str) -> str:
+    """Keep only letters and apostrophes, e.g. for rhyme and format-map keys"""
+    cleaned = word.translate(_DELETE_TBL)
+    if cleaned.isascii():
+        return cleaned
+    # Curly quotes, dashes, ellipses etc. from pasted lyrics
+    return ''.join(c for c in cleaned if c.isalpha() or c == "'")
+
+# Runs of letters and apostrophes, i.e. one lyric word with punctuation dropped
+_WORD_RE = re.compile(r"(?:[^\W\d_]|')+")
+
+# Punctuation that ends a lyric line when building the editor text
+_END_PUNCT = ('.', '!', '?', ':', ';')
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == '_'
+
+
+def _find_whole_words(text: str, words) -> List[Tuple[int, int, str]]:
+    """Find case-insensitive whole-word occurrences of any of ``words`` in one scan.
+
+    Returns ``(start, end, word)`` spans where ``word`` is the lowercased match.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise a
+    single regex alternation.
+    """
+    lowered = text.lower()
+    if AHOCORASICK_AVAILABLE and len(lowered) == len(text):
+        automaton = ahocorasick.Automaton()
+        for w in words:
+            automaton.add_word(w, w)
+        automaton.make_automaton()
+        spans = []
+        for end_idx, w in automaton.iter(lowered):
+            start = end_idx - len(w) + 1
+            end = end_idx + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            spans.append((start, end, w))
+        return spans
+
+    # Longest alternatives first so the regex prefers the full word
+    alternation = '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    boundary = r'(?<!\w)(?:' + alternation + r')(?!\w)'
+    if len(lowered) == len(text):
+        # Spans in the lowered text line up with the original, and every
+        # match is then exactly one of ``words``
+        pattern = re.compile(boundary)
+        return [(m.start(), m.end(), m.group(0)) for m in pattern.finditer(lowered)]
+
+    # IGNORECASE folds more than lower() undoes (e.g. 'ſ' matches 's'), so
+    # keep only matches that lowercase back to one of ``words``
+    keys = set(words)
+    pattern = re.compile(boundary, re.IGNORECASE)
+    spans = []
+    for m in pattern.finditer(text):
+        w = m.group(0).lower()
+        if w in keys:
+            spans.append((m.start(), m.end(), w))
+    return spans
+
+
 @dataclass
 class RhymeInfo:
     """Information about rhyming words"""
@@ -483,28 +563,57 @@ class RhymePanel(QWidget):
             self.near_rhymes_text.setPlainText("None found")
 
 
-class AudioPlaybackThread(QThread):
-    """Thread for playing audio segments"""
+class AudioPlaybackWorker(QThread):
+    """Long-lived thread that plays audio segments from a request queue"""
     
-    def __init__(self, audio_path: str, start_time: float, duration: float):
-        super().__init__()
+    def __init__(self, audio_path: str, parent=None):
+        super().__init__(parent)
         self.audio_path = audio_path
-        self.start_time = start_time
-        self.duration = duration
         self.player = None
+        self._requests = queue.Queue()
+        self._cancel = threading.Event()
+    
+    def request_segment(self, start_time: float, duration: float):
+        """Queue a segment, interrupting whatever is currently playing"""
+        self._cancel.set()
+        self._requests.put((start_time, duration))
+        if not self.isRunning():
+            self.start()
+    
+    def shutdown(self):
+        """Stop playback and wait for the thread to exit"""
+        self._cancel.set()
+        self._requests.put(None)
+        self.wait()
     
     def run(self):
-        """Play audio segment"""
+        """Load the audio once, then serve playback requests until shut down"""
         try:
-            from ..core.audio_player import AudioPlayer
             self.player = AudioPlayer()
             self.player.load(self.audio_path)
-            self.player.play_segment(self.start_time, self.start_time + self.duration)
-            # Wait for playback to complete
-            import time
-            time.sleep(self.duration)
         except Exception as e:
-            print(f"Audio playback error: {e}")
+            logging.error("Audio playback error: %s", e)
+            return
+        
+        while True:
+            request = self._requests.get()
+            # Only the most recent request matters
+            while request is not None and not self._requests.empty():
+                request = self._requests.get()
+            if request is None:
+                break
+            
+            self._cancel.clear()
+            start_time, duration = request
+            try:
+                self.player.play_segment(start_time, start_time + duration)
+            except Exception as e:
+                logging.error("Audio playback error: %s", e)
+                continue
+            # Wait for playback to complete unless a newer request cancels it
+            self._cancel.wait(duration)
+        
+        self.player.stop()
 
 
 class EnhancedLyricsEditor(QWidget):
@@ -517,20 +626,28 @@ class EnhancedLyricsEditor(QWidget):
         super().__init__(parent)
         self.audio_path = None
         self.lyrics_data = []
+        self._word_index: Dict[str, List[WordRow]] = {}  # lowercased text -> words
         self.rhyme_analyzer = RhymeAnalyzer()
         self.syllable_counter = SyllableCounter()
-        self.playback_thread = None
+        self._audio_worker = None
         self.color_mode = "confidence"  # "confidence" or "rhyme"
         self.rhyme_groups = {}
         self.near_rhyme_groups = {}
         self._rhyme_key_cache = {}
         self._near_key_cache = {}
         self._updating_text = False  # Flag to prevent recursion
+        self._plain_text_cache: Optional[str] = None  # Invalidated on every text change
+        self._wrap_cache_key: Optional[Tuple[str, int]] = None  # (text, width) last wrapped
         self.time_window = 2.0  # Default time window for audio playback
         # Debounce timer for heavy analysis/formatting
         self._debounce_timer = QTimer(self)
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.timeout.connect(self._analyze_and_color)
+        # Separate debounce for syllable counts, skipped when the text is unchanged
+        self._last_syllable_text: Optional[str] = None
+        self._syllable_timer = QTimer(self)
+        self._syllable_timer.setSingleShot(True)
+        self._syllable_timer.timeout.connect(self._update_syllable_counts)
         self.setup_ui()
     
     def setup_ui(self):
@@ -740,7 +857,7 @@ class EnhancedLyricsEditor(QWidget):
     def on_color_mode_changed(self, checked: bool):
         """Handle color mode toggle"""
         self.color_mode = "rhyme" if checked else "confidence"
-        self.apply_coloring()
+        self._recolor()
     
     def on_double_click(self, event):
         """Handle double-click to play audio"""
@@ -755,28 +872,25 @@ class EnhancedLyricsEditor(QWidget):
             return
         
         # Find the word in lyrics data and play audio
-        for word_data in self.lyrics_data:
-            if word_data.text.lower() == clean_word.lower():
-                start_time = word_data.start
-                end_time = word_data.end
-                
-                # Calculate time window around the word
-                word_duration = end_time - start_time
-                window_start = max(0, start_time - self.time_window)
-                window_end = end_time + self.time_window
-                duration = window_end - window_start
-                
-                print(f"Playing audio for word '{clean_word}' at {start_time:.2f}s with {duration:.2f}s window")
-                self.play_audio_requested.emit(window_start, duration)
-                
-                # Also start local playback thread
-                if self.playback_thread and self.playback_thread.isRunning():
-                    self.playback_thread.terminate()
-                    self.playback_thread.wait()
-                
-                self.playback_thread = AudioPlaybackThread(self.audio_path, window_start, duration)
-                self.playback_thread.start()
-                break
+        matches = self._word_index.get(clean_word.lower())
+        if matches:
+            word_data = matches[0]
+            start_time = word_data.start
+            end_time = word_data.end
+            
+            # Calculate time window around the word
+            word_duration = end_time - start_time
+            window_start = max(0, start_time - self.time_window)
+            window_end = end_time + self.time_window
+            duration = window_end - window_start
+            
+            logging.debug("Playing audio for word '%s' at %.2fs with %.2fs window",
+                          clean_word, start_time, duration)
+            self.play_audio_requested.emit(window_start, duration)
+            
+            # Also play locally through the persistent audio worker
+            if self._audio_worker is not None:
+                self._audio_worker.request_segment(window_start, duration)
         
         # Also update rhyme panel
         self.update_rhyme_panel(clean_word)
@@ -786,7 +900,7 @@ class EnhancedLyricsEditor(QWidget):
     
     def update_rhyme_panel(self, word: str):
         """Update the rhyme panel with suggestions for the selected word"""
-        text = self.text_edit.toPlainText()
+        text = self._plain_text()
         # Remove chord annotations for word analysis
         clean_text = text
         while '[' in clean_text and ']' in clean_text:
@@ -827,12 +941,29 @@ class EnhancedLyricsEditor(QWidget):
     
     def set_audio_path(self, audio_path: str):
         """Set the audio file path for playback"""
+        if audio_path != self.audio_path:
+            self.shutdown_audio()
         self.audio_path = audio_path
-        print(f"Enhanced lyrics editor audio path set to: {audio_path}")
+        if audio_path and self._audio_worker is None:
+            self._audio_worker = AudioPlaybackWorker(audio_path, self)
+        logging.debug("Enhanced lyrics editor audio path set to: %s", audio_path)
+    
+    def shutdown_audio(self):
+        """Stop the playback thread; Qt aborts if a running QThread is destroyed"""
+        if self._audio_worker is not None:
+            self._audio_worker.shutdown()
+            self._audio_worker.deleteLater()
+            self._audio_worker = None
     
     def set_lyrics_data(self, lyrics_data: List[WordRow]):
         """Set lyrics data and update display"""
         self.lyrics_data = lyrics_data
+        self._plain_text_cache = None
+        
+        # Index words by lowercased text for O(1) double-click lookup
+        self._word_index = {}
+        for word in lyrics_data:
+            self._word_index.setdefault(word.text.lower(), []).append(word)
         
         # Convert to text format with chords (CCLI style)
         text_lines = []
@@ -847,8 +978,7 @@ class EnhancedLyricsEditor(QWidget):
             current_line.append(word_text)
             
             # Check for line break (either from punctuation or stored line_break flag)
-            should_break = (word.text.endswith(('.', '!', '?', ':', ';')) or 
-                           getattr(word, 'line_break', False))
+            should_break = word.text.endswith(_END_PUNCT) or word.line_break
             
             if should_break:
                 text_lines.append(' '.join(current_line))
@@ -865,7 +995,7 @@ class EnhancedLyricsEditor(QWidget):
         self._updating_text = False
         
         # Update syllable counts
-        self.syllable_panel.update_counts('\n'.join(text_lines))
+        self._syllable_timer.start(100)
         # Ensure syllable panel scrolls to top initially
         self.syllable_panel.sync_syllable_scroll(0)
         
@@ -925,31 +1055,48 @@ class EnhancedLyricsEditor(QWidget):
                 )
                 lyrics_data.append(word_row)
             
-            print(f"Setting {len(lyrics_data)} words in enhanced lyrics editor")
+            logging.debug("Setting %d words in enhanced lyrics editor", len(lyrics_data))
             self.set_lyrics_data(lyrics_data)
     
     def on_text_changed(self):
         """Handle text changes"""
+        # Any document change invalidates the cached plain text
+        self._plain_text_cache = None
+        
         # Prevent recursion when programmatically updating text
         if self._updating_text:
             return
             
-        text = self.text_edit.toPlainText()
+        text = self._plain_text()
         self.lyrics_changed.emit(text)
         
         # Update syllable counts based on current displayed text
-        self.syllable_panel.update_counts(text)
+        self._syllable_timer.start(100)
         
         # Debounce rhyme analysis
         self._debounce_timer.start(250)
     
+    def _update_syllable_counts(self):
+        """Recount syllables unless the text is unchanged since the last count"""
+        text = self._plain_text()
+        if text == self._last_syllable_text:
+            return
+        self._last_syllable_text = text
+        self.syllable_panel.update_counts(text)
+    
+    def _plain_text(self) -> str:
+        """Return the editor text, copying it out of the document once per edit cycle"""
+        if self._plain_text_cache is None:
+            self._plain_text_cache = self.text_edit.toPlainText()
+        return self._plain_text_cache
+    
     def apply_auto_wrapping(self):
         """Apply automatic text wrapping based on available editor width"""
         if not self.lyrics_data:
             return
         
         # Get current text and document
-        text = self.text_edit.toPlainText()
+        text = self._plain_text()
         
         # Don't apply auto-wrapping if there's no text yet
         if not text.strip():
@@ -962,11 +1109,18 @@ class EnhancedLyricsEditor(QWidget):
         if editor_width < 200:
             return
         
+        # Nothing to do if neither the text nor the width changed since last time
+        key = (text, editor_width)
+        if key == self._wrap_cache_key:
+            return
+        self._wrap_cache_key = key
+        
         # Use a more aggressive approach: force wrapping at a reasonable character limit
         # This ensures the text is actually wrapped and visible
         max_chars_per_line = 60  # Force wrapping at 60 characters for better readability
         
-        print(f"Auto-wrapping: editor width={editor_width}, max chars per line={max_chars_per_line}")
+        logging.debug("Auto-wrapping: editor width=%d, max chars per line=%d",
+                      editor_width, max_chars_per_line)
         
         # Process each line to check for wrapping
         lines = text.split('\n')
@@ -1007,11 +1161,13 @@ class EnhancedLyricsEditor(QWidget):
         
         # Update the text if changes were made
         new_text = '\n'.join(new_lines)
-        print(f"Original text has {len(text.split(chr(10)))} lines, new text has {len(new_text.split(chr(10)))} lines")
+        
+        # Wrapping is idempotent, so the wrapped text needs no second pass
+        self._wrap_cache_key = (new_text, editor_width)
         
         if new_text != text:
-            print(f"Auto-wrapping applied: {len(text.split())} words, {len(new_text.split(chr(10)))} lines")
-            print(f"First few lines of new text: {new_text[:200]}...")
+            logging.debug("Auto-wrapping applied: %d lines -> %d lines",
+                          text.count('\n') + 1, new_text.count('\n') + 1)
             
             # Prevent recursion
             self._updating_text = True
@@ -1029,9 +1185,9 @@ class EnhancedLyricsEditor(QWidget):
             self.update_lyrics_data_with_line_breaks(new_text)
             
             # Update syllable counts based on the wrapped text
-            self.syllable_panel.update_counts(new_text)
+            self._syllable_timer.start(100)
         else:
-            print("No auto-wrapping needed")
+            logging.debug("No auto-wrapping needed")
     
     def update_lyrics_data_with_line_breaks(self, text: str):
         """Update lyrics data to include line break information"""
@@ -1053,148 +1209,114 @@ class EnhancedLyricsEditor(QWidget):
     def _analyze_and_color(self):
         """Analyze text and apply coloring"""
         self.analyze_rhymes()
-        self._reset_formatting()
-        self.apply_coloring()
+        self._recolor()
+    
+    def _recolor(self):
+        """Redo the coloring without reporting it as a lyrics change"""
+        # Format-only changes still fire textChanged
+        self._updating_text = True
+        try:
+            self._reset_formatting()
+            self.apply_coloring()
+        finally:
+            self._updating_text = False
     
     def apply_coloring(self):
         """Apply color coding based on current mode"""
-        if self.color_mode == "confidence":
-            # Apply confidence coloring first, then rhyme coloring on top
-            self.apply_confidence_coloring()
-            self.apply_rhyme_coloring()
-        else:
-            # Apply rhyme coloring first, then confidence coloring on top
-            self.apply_rhyme_coloring()
-            self.apply_confidence_coloring()
+        # Share one cursor and one edit block so Qt coalesces the change signals
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.beginEditBlock()
+        try:
+            if self.color_mode == "confidence":
+                # Apply confidence coloring first, then rhyme coloring on top
+                self.apply_confidence_coloring(cursor)
+                self.apply_rhyme_coloring(cursor)
+            else:
+                # Apply rhyme coloring first, then confidence coloring on top
+                self.apply_rhyme_coloring(cursor)
+                self.apply_confidence_coloring(cursor)
+        finally:
+            cursor.endEditBlock()
     
-    def apply_rhyme_coloring(self):
+    def apply_rhyme_coloring(self, cursor: Optional[QTextCursor] = None):
         """Apply rhyme-based color coding. Perfect groups are bold; near groups not bold."""
         colors = [
             QColor(255, 0, 0), QColor(0, 128, 0), QColor(0, 0, 200), QColor(200, 120, 0),
             QColor(128, 0, 128), QColor(200, 0, 100), QColor(0, 160, 160), QColor(160, 160, 0),
         ]
-        doc = self.text_edit.document()
-
-        # First, set all words to black (default for non-rhyming words)
-        black_fmt = QTextCharFormat()
-        black_fmt.setForeground(QColor(0, 0, 0))
-        black_fmt.setFontWeight(QFont.Normal)
-        
-        # Get all words from the text
-        text = self.text_edit.toPlainText()
-        all_words = []
-        for line in text.split('\n'):
-            for word in line.split():
-                # Clean word of punctuation and brackets, but preserve apostrophes
-                # Handle contractions like "don't", "can't", "I'll" as single words
-                clean_word = ''
-                for c in word:
-                    if c.isalpha() or c == "'":
-                        clean_word += c
-                if clean_word:
-                    all_words.append(clean_word.lower())
-        
-        # Also handle chord annotations by extracting words from them
-        # Look for patterns like [C]word or word[C] and extract the word part
-        chord_pattern = r'\[([^\]]+)\]([a-zA-Z\']+)|([a-zA-Z\']+)\[([^\]]+)\]'
-        import re
-        matches = re.findall(chord_pattern, text)
-        for match in matches:
-            if match[1]:  # [C]word pattern
-                clean_word = ''.join(c for c in match[1] if c.isalpha() or c == "'")
-                if clean_word:
-                    all_words.append(clean_word.lower())
-            if match[2]:  # word[C] pattern
-                clean_word = ''.join(c for c in match[2] if c.isalpha() or c == "'")
-                if clean_word:
-                    all_words.append(clean_word.lower())
-        
-        # Set all words to black first
-        for word in set(all_words):
-            # Use word boundaries to avoid partial matches
-            cursor = doc.find(word, 0, QTextDocument.FindWholeWords)
-            while not cursor.isNull():
-                cursor.mergeCharFormat(black_fmt)
-                cursor = doc.find(word, cursor, QTextDocument.FindWholeWords)
+        fmt_map: Dict[str, QTextCharFormat] = {}
 
-        # Apply perfect rhyme groups (bold)
+        # Perfect rhyme groups (bold)
         group_to_words = {}
         for w, g in self.rhyme_groups.items():
             group_to_words.setdefault(g, []).append(w)
 
         for i, (group_name, words) in enumerate(group_to_words.items()):
-            color = colors[i % len(colors)]
             fmt = QTextCharFormat()
-            fmt.setForeground(color)
+            fmt.setForeground(colors[i % len(colors)])
             fmt.setFontWeight(QFont.Bold)
             for w in words:
-                # Search for the word in the text and apply formatting
                 # Handle apostrophes by searching for the clean version
-                clean_word = ''.join(c for c in w if c.isalpha() or c == "'")
-                cursor = doc.find(clean_word, 0, QTextDocument.FindWholeWords)
-                while not cursor.isNull():
-                    cursor.mergeCharFormat(fmt)
-                    cursor = doc.find(clean_word, cursor, QTextDocument.FindWholeWords)
+                fmt_map[_clean_word(w)] = fmt
 
-        # Apply near rhyme groups (same palette, not bold)
+        # Near rhyme groups (same palette, not bold)
         near_group_to_words = {}
         for w, g in self.near_rhyme_groups.items():
             near_group_to_words.setdefault(g, []).append(w)
 
         for i, (group_name, words) in enumerate(near_group_to_words.items()):
-            color = colors[i % len(colors)]
             fmt = QTextCharFormat()
-            fmt.setForeground(color)
+            fmt.setForeground(colors[i % len(colors)])
             fmt.setFontWeight(QFont.Normal)
             for w in words:
-                # Search for the word in the text and apply formatting
-                # Handle apostrophes by searching for the clean version
-                clean_word = ''.join(c for c in w if c.isalpha() or c == "'")
-                cursor = doc.find(clean_word, 0, QTextDocument.FindWholeWords)
-                while not cursor.isNull():
-                    cursor.mergeCharFormat(fmt)
-                    cursor = doc.find(clean_word, cursor, QTextDocument.FindWholeWords)
+                fmt_map.setdefault(_clean_word(w), fmt)
+
+        fmt_map.pop('', None)
+        if not fmt_map:
+            return
+
+        # Locate every rhyming word in one pass over the text
+        if cursor is None:
+            cursor = QTextCursor(self.text_edit.document())
+        for start, end, word in _find_whole_words(self._plain_text(), fmt_map):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.mergeCharFormat(fmt_map[word])
     
-    def apply_confidence_coloring(self):
+    def apply_confidence_coloring(self, cursor: Optional[QTextCursor] = None):
         """Apply confidence-based color coding to all words"""
-        doc = self.text_edit.document()
-        
         if not self.lyrics_data:
             return
-            
+        
+        # One foreground-only format per distinct word; as before, the last
+        # occurrence of a word in the lyrics data decides its color. Leaving the
+        # weight unset preserves existing formatting (like bold for rhymes).
+        fmt_map: Dict[str, QTextCharFormat] = {}
         for word_data in self.lyrics_data:
-            # Calculate color based on confidence
+            # Handle words with apostrophes by searching for the clean version
+            clean_word = _clean_word(word_data.text).lower()
+            if not clean_word:
+                continue
             confidence = word_data.confidence
             red = int(255 * (1.0 - confidence))
             green = int(255 * confidence)
-            color = QColor(red, green, 0)
-            
-            # Create format - preserve existing formatting (like bold for rhymes)
-            format = QTextCharFormat()
-            format.setForeground(color)
-            
-            # Find and format the word (search for the word text only, not with chord)
-            word_text = word_data.text
-            
-            # Handle words with apostrophes by searching for the clean version
-            clean_word = ''.join(c for c in word_text if c.isalpha() or c == "'")
-            
-            # Search for the word in the text
-            cursor = doc.find(clean_word, 0, QTextDocument.FindWholeWords)
-            
-            while not cursor.isNull():
-                # Get current format and merge with confidence color
-                current_format = cursor.charFormat()
-                merged_format = QTextCharFormat()
-                merged_format.setForeground(color)
-                # Preserve font weight (bold for perfect rhymes)
-                merged_format.setFontWeight(current_format.fontWeight())
-                cursor.mergeCharFormat(merged_format)
-                cursor = doc.find(clean_word, cursor, QTextDocument.FindWholeWords)
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(red, green, 0))
+            fmt_map[clean_word] = fmt
+        
+        if not fmt_map:
+            return
+        
+        if cursor is None:
+            cursor = QTextCursor(self.text_edit.document())
+        for start, end, word in _find_whole_words(self._plain_text(), fmt_map):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.mergeCharFormat(fmt_map[word])
     
     def analyze_rhymes(self):
         """Analyze rhyming patterns using pronunciation-based grouping with fallbacks."""
-        text = self.text_edit.toPlainText()
+        text = self._plain_text()
         # Remove chord annotations like [C]
         clean_text = text
         while '[' in clean_text and ']' in clean_text:
@@ -1204,17 +1326,9 @@ class EnhancedLyricsEditor(QWidget):
                 break
             clean_text = clean_text[:start] + clean_text[end+1:]
 
-        # Simple word extraction
-        words = []
-        for word in clean_text.lower().split():
-            # Clean word of punctuation and brackets, but preserve apostrophes
-            # Handle contractions like "don't", "can't", "I'll" as single words
-            cleaned = ''
-            for c in word:
-                if c.isalpha() or c == "'":
-                    cleaned += c
-            if cleaned:
-                words.append(cleaned)
+        # Simple word extraction; apostrophes are kept so contractions
+        # like "don't", "can't", "I'll" stay single words
+        words = _WORD_RE.findall(clean_text.lower())
 
         unique_words = list(dict.fromkeys(words))
         
@@ -1246,11 +1360,10 @@ class EnhancedLyricsEditor(QWidget):
             for w in group_words:
                 self.rhyme_groups[w] = group_name
 
-        # Near rhyme groups by near_rhyme_key for remaining words
+        # Near rhyme groups by near_rhyme_key, skipping words already in perfect rhyme groups
+        near_candidates = [w for w in remaining_words if w not in self.rhyme_groups]
         near_key_to_words = {}
-        for w in remaining_words:
-            if w in self.rhyme_groups:  # Skip words already in perfect rhyme groups
-                continue
+        for w in near_candidates:
             if w in self._near_key_cache:
                 nkey = self._near_key_cache[w]
             else:
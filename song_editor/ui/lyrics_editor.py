@@ -6,30 +6,326 @@ Lyrics editing interface for Song Editor 3.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QSpinBox, QDoubleSpinBox,
-    QGroupBox, QGridLayout, QHeaderView, QMessageBox, QComboBox,
-    QCheckBox, QLineEdit, QSplitter
+    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QTableView,
+    QAbstractItemView, QPushButton, QLabel, QSpinBox, QDoubleSpinBox,
+    QGroupBox, QGridLayout, QHeaderView, QComboBox,
+    QCheckBox, QLineEdit, QSplitter, QStyledItemDelegate
+)
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QAbstractTableModel, QModelIndex, QSignalBlocker
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont, QColor, QBrush, QTextCursor
 
 from ..models.song_data import SongData, Word
 
 
+# A word in the lyrics text is any run of non-whitespace
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def _format_column(values: np.ndarray) -> List[str]:
+    """Format a numeric column the way the word table displays it."""
+    return [f"{v:.3f}" for v in values.tolist()]
+
+
+class WordTableModel(QAbstractTableModel):
+    """Table model over the editor's word list.
+    
+    The view only asks for the rows it shows, so refreshing the table no longer
+    allocates an item per cell. Timing and confidence are also kept as parallel
+    NumPy columns so bulk passes can run vectorized; the ``Word`` objects stay
+    authoritative and every write goes through to them.
+    """
+    
+    HEADERS = ["Text", "Start Time", "End Time", "Confidence", "Chord"]
+    
+    word_edited = Signal(int, int)
+    
+    def __init__(self, words: List[Word], parent=None):
+        super().__init__(parent)
+        self.words = words
+        # Confidence gradient from red (0.0) to green (1.0), built once
+        self._conf_brushes = [QBrush(QColor(255 - i, i, 0)) for i in range(256)]
+        self._rebuild_columns()
+    
+    def _rebuild_columns(self):
+        """Snapshot the numeric word fields into the NumPy columns."""
+        n = len(self.words)
+        self.starts = np.fromiter((w.start for w in self.words), dtype=np.float64, count=n)
+        self.ends = np.fromiter((w.end for w in self.words), dtype=np.float64, count=n)
+        self.confidences = np.fromiter((w.confidence for w in self.words), dtype=np.float64, count=n)
+        # Display strings are formatted once per change, not once per paint
+        self._start_strs = _format_column(self.starts)
+        self._end_strs = _format_column(self.ends)
+        self._conf_strs = _format_column(self.confidences)
+    
+    def set_words(self, words: List[Word]):
+        """Point the model at a (possibly new) word list."""
+        self.beginResetModel()
+        self.words = words
+        self._rebuild_columns()
+        self.endResetModel()
+    
+    def replace_words(self, words: List[Word]):
+        """Replace the contents of the current word list behind one reset."""
+        self.beginResetModel()
+        self.words[:] = words
+        self._rebuild_columns()
+        self.endResetModel()
+    
+    def refresh_words(self):
+        """Re-read the current words, resetting only if the row count changed."""
+        if len(self.words) != len(self.starts):
+            self.beginResetModel()
+            self._rebuild_columns()
+            self.endResetModel()
+            return
+        self._rebuild_columns()
+        self._emit_columns_changed(0, len(self.HEADERS) - 1)
+    
+    def insert_words(self, row: int, words: List[Word]):
+        """Insert words before ``row``."""
+        if not words:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(words) - 1)
+        self.words[row:row] = words
+        self.starts = np.insert(self.starts, row, [w.start for w in words])
+        self.ends = np.insert(self.ends, row, [w.end for w in words])
+        self.confidences = np.insert(self.confidences, row, [w.confidence for w in words])
+        self._start_strs[row:row] = [f"{w.start:.3f}" for w in words]
+        self._end_strs[row:row] = [f"{w.end:.3f}" for w in words]
+        self._conf_strs[row:row] = [f"{w.confidence:.3f}" for w in words]
+        self.endInsertRows()
+    
+    def remove_words(self, first: int, last: int):
+        """Remove the words in rows ``[first, last)``."""
+        if first >= last:
+            return
+        self.beginRemoveRows(QModelIndex(), first, last - 1)
+        del self.words[first:last]
+        self.starts = np.delete(self.starts, np.s_[first:last])
+        self.ends = np.delete(self.ends, np.s_[first:last])
+        self.confidences = np.delete(self.confidences, np.s_[first:last])
+        del self._start_strs[first:last]
+        del self._end_strs[first:last]
+        del self._conf_strs[first:last]
+        self.endRemoveRows()
+    
+    def swap_words(self, row: int):
+        """Swap the word at ``row`` with the one after it."""
+        # Destination is the row after the one we swap with
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row + 2)
+        self.words[row], self.words[row + 1] = self.words[row + 1], self.words[row]
+        for column in (self.starts, self.ends, self.confidences):
+            column[[row, row + 1]] = column[[row + 1, row]]
+        for strings in (self._start_strs, self._end_strs, self._conf_strs):
+            strings[row], strings[row + 1] = strings[row + 1], strings[row]
+        self.endMoveRows()
+    
+    def set_timings(self, starts: np.ndarray, ends: np.ndarray):
+        """Replace every word's start and end time."""
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        for word, start, end in zip(self.words, self.starts.tolist(), self.ends.tolist()):
+            word.start = start
+            word.end = end
+        self._start_strs = _format_column(self.starts)
+        self._end_strs = _format_column(self.ends)
+        self._emit_columns_changed(1, 2)
+    
+    def set_confidences(self, confidences: np.ndarray):
+        """Replace every word's confidence."""
+        self.confidences = np.asarray(confidences, dtype=np.float64)
+        for word, confidence in zip(self.words, self.confidences.tolist()):
+            word.confidence = confidence
+        self._conf_strs = _format_column(self.confidences)
+        # The text column is colored by confidence too
+        self._emit_columns_changed(0, 3)
+    
+    def raise_confidences(self, floor: float) -> int:
+        """Lift confidences below floor up to it and return how many changed."""
+        rows = np.flatnonzero(self.confidences < floor)
+        if rows.size == 0:
+            return 0
+        self.confidences[rows] = floor
+        text = f"{floor:.3f}"
+        for row in rows.tolist():
+            self.words[row].confidence = floor
+            self._conf_strs[row] = text
+        # The text column is colored by confidence too
+        self.dataChanged.emit(self.index(int(rows[0]), 0), self.index(int(rows[-1]), 3))
+        return int(rows.size)
+    
+    def _emit_columns_changed(self, first_col: int, last_col: int):
+        if self.words:
+            self.dataChanged.emit(self.index(0, first_col),
+                                  self.index(len(self.words) - 1, last_col))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.words)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        col = index.column()
+        
+        if role == Qt.EditRole and col in (1, 2, 3):
+            # Numeric editors get the raw value, see NumericDelegate
+            return float((self.starts, self.ends, self.confidences)[col - 1][row])
+        
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == 0:
+                return self.words[row].text
+            elif col == 1:
+                return self._start_strs[row]
+            elif col == 2:
+                return self._end_strs[row]
+            elif col == 3:
+                return self._conf_strs[row]
+            elif col == 4:
+                return self.words[row].chord or ""
+        elif role == Qt.ForegroundRole and col in (0, 3):
+            # Confidence-based coloring of the text and confidence columns
+            return self._conf_brushes[min(255, max(0, int(self.confidences[row] * 255)))]
+        
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        
+        row = index.row()
+        col = index.column()
+        word = self.words[row]
+        
+        # Numeric columns are edited through NumericDelegate, so values
+        # arrive already parsed and range-checked
+        # Opening and closing an editor without changing anything is not an
+        # edit. Spin boxes round to the 3 decimals shown, so compare those
+        if col in (1, 2, 3):
+            value = float(value)
+            shown = (self._start_strs, self._end_strs, self._conf_strs)[col - 1][row]
+            unchanged = f"{value:.3f}" == shown
+        elif col == 4:
+            value = value if value else None
+            unchanged = value == word.chord
+        else:
+            unchanged = value == word.text
+        if unchanged:
+            return True
+        
+        if col == 0:  # Text
+            word.text = value
+        elif col == 1:  # Start time
+            word.start = self.starts[row] = value
+            self._start_strs[row] = f"{word.start:.3f}"
+        elif col == 2:  # End time
+            word.end = self.ends[row] = value
+            self._end_strs[row] = f"{word.end:.3f}"
+        elif col == 3:  # Confidence
+            word.confidence = self.confidences[row] = value
+            self._conf_strs[row] = f"{word.confidence:.3f}"
+        elif col == 4:  # Chord
+            word.chord = value
+        
+        # Confidence also recolors the text column, so refresh the whole row
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        self.word_edited.emit(row, col)
+        return True
+
+
+class NumericDelegate(QStyledItemDelegate):
+    """Edits a numeric word column with a range-limited spin box."""
+    
+    def __init__(self, minimum: float, maximum: float, parent=None):
+        super().__init__(parent)
+        self.minimum = minimum
+        self.maximum = maximum
+    
+    def createEditor(self, parent, option, index):
+        editor = QDoubleSpinBox(parent)
+        editor.setRange(self.minimum, self.maximum)
+        editor.setDecimals(3)
+        editor.setSingleStep(0.1)
+        editor.setFrame(False)
+        return editor
+
+
 class LyricsEditor(QWidget):
     """Lyrics editing interface."""
     
-    lyrics_changed = Signal(list)
+    lyrics_changed = Signal()  # receivers pull the words via get_words()
     
     def __init__(self):
         super().__init__()
         self.song_data = None
         self.words = []
+        # Nesting depth of batch() and whether the batch modified the words
+        self._signal_depth = 0
+        self._dirty = False
+        # Typing is coalesced so the text is re-split once per pause
+        self._text_change_timer = QTimer(self)
+        self._text_change_timer.setSingleShot(True)
+        self._text_change_timer.timeout.connect(self._flush_text_change)
+        # Character span of each word in the text editor, index-aligned with
+        # self.words, plus the edited range not yet folded into the words as
+        # (position, chars_removed, chars_added) relative to those spans
+        self._word_starts: List[int] = []
+        self._word_ends: List[int] = []
+        self._synced_length = 0
+        self._pending_change: Optional[Tuple[int, int, int]] = None
+        # Display refreshes requested during one event-loop turn collapse into one
+        self._refresh_pending = False
+        self._refresh_text = False
+        self._refresh_table = False
         self.init_ui()
     
+    @contextmanager
+    def batch(self):
+        """Group word changes into a single lyrics_changed emit.
+        
+        Code inside the block sets ``self._dirty`` when it modified the words.
+        """
+        self._signal_depth += 1
+        try:
+            yield
+        finally:
+            self._signal_depth -= 1
+            if self._signal_depth == 0 and self._dirty:
+                self._dirty = False
+                self.lyrics_changed.emit()
+    
+    @contextmanager
+    def _table_updates_paused(self):
+        """Suspend table repaints while the model is reset."""
+        self.word_table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.word_table.setUpdatesEnabled(True)
+    
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
@@ -63,6 +359,7 @@ class LyricsEditor(QWidget):
         self.text_editor = QTextEdit()
         self.text_editor.setFont(QFont("Courier", 12))
         self.text_editor.textChanged.connect(self.on_text_changed)
+        self.text_editor.document().contentsChange.connect(self.on_contents_change)
         layout.addWidget(self.text_editor)
         
         # Word count
@@ -78,21 +375,31 @@ class LyricsEditor(QWidget):
         
         # Table
         layout.addWidget(QLabel("Word Details:"))
-        self.word_table = QTableWidget()
-        self.word_table.setColumnCount(5)
-        self.word_table.setHorizontalHeaderLabels([
-            "Text", "Start Time", "End Time", "Confidence", "Chord"
-        ])
+        self.word_model = WordTableModel(self.words, self)
+        self.word_table = QTableView()
+        self.word_table.setModel(self.word_model)
         
-        # Set table properties
+        # Set table properties. Fixed widths and uniform row heights keep Qt
+        # from measuring every row, so rendering scales with the viewport
         header = self.word_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        
-        self.word_table.itemChanged.connect(self.on_table_item_changed)
+        for col, width in ((1, 80), (2, 80), (3, 80), (4, 60)):
+            header.setSectionResizeMode(col, QHeaderView.Fixed)
+            header.resizeSection(col, width)
+        self.word_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.word_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # Rows follow the lyric order, and wrapped cells would need measuring
+        self.word_table.setSortingEnabled(False)
+        self.word_table.setWordWrap(False)
+        
+        # Same ranges as the timing controls below
+        self.time_delegate = NumericDelegate(0, 9999, self.word_table)
+        self.confidence_delegate = NumericDelegate(0, 1, self.word_table)
+        self.word_table.setItemDelegateForColumn(1, self.time_delegate)
+        self.word_table.setItemDelegateForColumn(2, self.time_delegate)
+        self.word_table.setItemDelegateForColumn(3, self.confidence_delegate)
+        
+        self.word_model.word_edited.connect(self.on_table_item_changed)
         layout.addWidget(self.word_table)
         
         return panel
@@ -167,138 +474,342 @@ class LyricsEditor(QWidget):
         
         layout.addStretch()
         
+        # Non-modal feedback for edit actions, cleared after a few seconds
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(3000)
+        self._status_timer.timeout.connect(self.status_label.clear)
+        
         return panel
     
+    def show_status(self, message: str):
+        """Show a short status message next to the controls."""
+        self.status_label.setText(message)
+        # Restarting keeps an older message's timeout from clearing this one
+        self._status_timer.start()
+    
     def set_song_data(self, song_data: SongData):
         """Set the song data to edit."""
         self.song_data = song_data
-        self.words = song_data.words.copy()
-        self.update_display()
+        self._load_words(song_data.words)
+    
+    def _load_words(self, words: List[Word]):
+        """Replace the word list with one model reset and one text reload."""
+        # Anything queued against the old words is obsolete
+        self._text_change_timer.stop()
+        self._refresh_pending = False
+        self._refresh_text = False
+        self._refresh_table = False
+        
+        with self._table_updates_paused():
+            if self.word_model.words is self.words:
+                self.word_model.replace_words(words)
+            else:
+                # The model is not showing this list, so it can change freely
+                self.words[:] = words
+                self.word_model.set_words(self.words)
+        self.update_text()
+    
+    def _schedule_refresh(self, text: bool = True, table: bool = False):
+        """Refresh the text editor and/or the table on the next event-loop turn."""
+        self._refresh_text = self._refresh_text or text
+        self._refresh_table = self._refresh_table or table
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the refresh collapsed from all pending requests."""
+        if not self._refresh_pending:
+            return
+        refresh_text = self._refresh_text
+        refresh_table = self._refresh_table
+        self._refresh_pending = False
+        self._refresh_text = False
+        self._refresh_table = False
+        if refresh_text:
+            self.update_text()
+        if refresh_table:
+            self.update_table()
     
     def update_display(self):
         """Update the display with current word data."""
-        # Update text editor
+        self.update_text()
+        self.update_table()
+    
+    def update_text(self):
+        """Update the text editor and word count from the word list."""
         text = ' '.join(word.text for word in self.words)
-        self.text_editor.blockSignals(True)
-        self.text_editor.setPlainText(text)
-        self.text_editor.blockSignals(False)
+        with QSignalBlocker(self.text_editor):
+            self.text_editor.setPlainText(text)
+        self._sync_word_spans()
         
         # Update word count
-        self.word_count_label.setText(f"Words: {len(self.words)}")
-        
-        # Update table
-        self.update_table()
+        self._update_word_count()
+    
+    def _sync_word_spans(self):
+        """Recompute word spans for text that is exactly the words joined by spaces."""
+        starts = []
+        ends = []
+        offset = 0
+        for word in self.words:
+            starts.append(offset)
+            offset += len(word.text)
+            ends.append(offset)
+            offset += 1
+        self._word_starts = starts
+        self._word_ends = ends
+        self._synced_length = max(0, offset - 1)
+        self._pending_change = None
+    
+    def _ensure_model(self):
+        """Point the table model at self.words if a deferred refresh has not yet."""
+        if self.word_model.words is not self.words:
+            self.word_model.set_words(self.words)
     
     def update_table(self):
-        """Update the word table with confidence-based coloring."""
-        self.word_table.blockSignals(True)
-        self.word_table.setRowCount(len(self.words))
-        
-        for row, word in enumerate(self.words):
-            # Text
-            text_item = QTableWidgetItem(word.text)
-            self.word_table.setItem(row, 0, text_item)
-            
-            # Start time
-            start_item = QTableWidgetItem(f"{word.start:.3f}")
-            self.word_table.setItem(row, 1, start_item)
-            
-            # End time
-            end_item = QTableWidgetItem(f"{word.end:.3f}")
-            self.word_table.setItem(row, 2, end_item)
-            
-            # Confidence
-            conf_item = QTableWidgetItem(f"{word.confidence:.3f}")
-            self.word_table.setItem(row, 3, conf_item)
-            
-            # Chord
-            chord_item = QTableWidgetItem(word.chord or "")
-            self.word_table.setItem(row, 4, chord_item)
-            
-            # Apply confidence-based coloring to the text column
-            confidence = word.confidence
-            red = int(255 * (1.0 - confidence))
-            green = int(255 * confidence)
-            color = QColor(red, green, 0)
-            
-            # Apply color to the text, not the background
-            text_item.setForeground(color)
-            
-            # Also color the confidence column text to make it more visible
-            conf_item.setForeground(color)
-        
-        self.word_table.blockSignals(False)
+        """Update the word table; the view re-reads only the rows it shows."""
+        with self._table_updates_paused():
+            if self.word_model.words is self.words:
+                # Same rows: keep selection, scroll position and open editors
+                self.word_model.refresh_words()
+            else:
+                self.word_model.set_words(self.words)
     
     def on_text_changed(self):
         """Handle text editor changes."""
+        self._text_change_timer.start(50)
+    
+    def on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """Accumulate the edited document range until the next flush."""
+        if self._pending_change is None:
+            self._pending_change = (position, chars_removed, chars_added)
+            return
+        
+        # Merge with the pending edit into one range relative to the synced text
+        pending_pos, pending_removed, pending_added = self._pending_change
+        start = min(pending_pos, position)
+        end_current = max(pending_pos + pending_added, position + chars_removed)
+        end_synced = end_current - (pending_added - pending_removed)
+        end_new = end_current + (chars_added - chars_removed)
+        self._pending_change = (start, end_synced - start, end_new - start)
+    
+    def _flush_text_change(self):
+        """Sync the word list with the text editor after typing pauses."""
+        change, self._pending_change = self._pending_change, None
+        if change is None:
+            # Only formatting changed; the words are already in sync
+            return
+        
         text = self.text_editor.toPlainText()
+        if not self._apply_text_change(text, *change):
+            self._resplit_text(text)
+        
+        self._update_word_count()
+        self.lyrics_changed.emit()
+    
+    def _apply_text_change(self, text: str, position: int, chars_removed: int,
+                           chars_added: int) -> bool:
+        """Re-split only the words touched by an edit and patch them in place.
+        
+        Returns False when the edit cannot be mapped onto the current spans,
+        in which case the caller falls back to a full re-split.
+        """
+        starts = self._word_starts
+        ends = self._word_ends
+        if len(starts) != len(self.words) or self.word_model.words is not self.words:
+            return False
+        
+        # QTextDocument may count the trailing block separator; clamp to the text
+        chars_removed = min(chars_removed, self._synced_length - position)
+        chars_added = min(chars_added, len(text) - position)
+        if position < 0 or chars_removed < 0 or chars_added < 0:
+            return False
+        delta = chars_added - chars_removed
+        if len(text) - self._synced_length != delta:
+            return False
+        
+        # Old words [first, last) touch the edited range; neighbours outside it
+        # are separated from it by unchanged whitespace
+        first = bisect_left(ends, position)
+        last = bisect_right(starts, position + chars_removed)
+        region_start = position
+        region_end = position + chars_added
+        if first < last:
+            region_start = min(starts[first], region_start)
+            region_end = max(ends[last - 1] + delta, region_end)
+        
+        tokens = [(m.start(), m.end(), m.group())
+                  for m in _TOKEN_RE.finditer(text, region_start, region_end)]
+        old_count = last - first
+        new_count = len(tokens)
+        common = min(old_count, new_count)
+        
+        # Reuse the existing words for the re-split region to keep their timing
+        for k in range(common):
+            self.words[first + k].text = tokens[k][2]
+        
+        if old_count > new_count:
+            self.word_model.remove_words(first + new_count, last)
+        elif new_count > old_count:
+            # Create new words with default timing (0.5s per word)
+            new_words = [self._new_word(tokens[k][2], (first + k) * 0.5)
+                         for k in range(old_count, new_count)]
+            self.word_model.insert_words(first + old_count, new_words)
+        
+        if common:
+            self.word_model.dataChanged.emit(
+                self.word_model.index(first, 0),
+                self.word_model.index(first + common - 1, self.word_model.columnCount() - 1)
+            )
+        
+        # Patch the spans: re-split region replaced, later words shifted
+        starts[first:last] = [t[0] for t in tokens]
+        ends[first:last] = [t[1] for t in tokens]
+        if delta:
+            tail = first + new_count
+            starts[tail:] = [v + delta for v in starts[tail:]]
+            ends[tail:] = [v + delta for v in ends[tail:]]
+        self._synced_length = len(text)
+        return True
+    
+    @staticmethod
+    def _new_word(text: str, start: float) -> Word:
+        """Return a word with default timing."""
+        return Word(text=text, start=start, end=start + 0.5, confidence=0.5)
+    
+    def _resplit_text(self, text: str):
+        """Rebuild the word list from the whole text, preserving timing by position."""
         new_words = text.split()
         
         # Update word texts while preserving timing
-        for i, word in enumerate(self.words):
-            if i < len(new_words):
-                word.text = new_words[i]
-            else:
-                # Remove extra words
-                self.words = self.words[:len(new_words)]
-                break
+        for word, word_text in zip(self.words, new_words):
+            word.text = word_text
+        
+        # Remove extra words in place; the table is reset below
+        if len(self.words) > len(new_words):
+            del self.words[len(new_words):]
         
         # Add new words if needed
         while len(self.words) < len(new_words):
             # Create new word with default timing
             start_time = len(self.words) * 0.5  # Default 0.5s per word
-            end_time = start_time + 0.5
-            new_word = Word(
-                text=new_words[len(self.words)],
-                start=start_time,
-                end=end_time,
-                confidence=0.5
-            )
-            self.words.append(new_word)
+            self.words.append(self._new_word(new_words[len(self.words)], start_time))
         
         self.update_table()
-        self.word_count_label.setText(f"Words: {len(self.words)}")
-        self.lyrics_changed.emit(self.words)
-    
-    def on_table_item_changed(self, item):
-        """Handle table item changes."""
-        row = item.row()
-        col = item.column()
         
-        if row >= len(self.words):
+        spans = [m.span() for m in _TOKEN_RE.finditer(text)]
+        self._word_starts = [span[0] for span in spans]
+        self._word_ends = [span[1] for span in spans]
+        self._synced_length = len(text)
+    
+    def on_table_item_changed(self, row: int, col: int):
+        """Handle an edit committed through the word table."""
+        # Only the text column is shown in the text editor
+        if col == 0:
+            self._replace_word_text(row)
+        self.lyrics_changed.emit()
+    
+    def _text_in_sync(self) -> bool:
+        """Flush pending typing and report whether the word spans match the document."""
+        # Fold in any typing that has not been flushed yet so the spans are current
+        if self._pending_change is not None:
+            self._text_change_timer.stop()
+            self._flush_text_change()
+        return (not (self._refresh_pending and self._refresh_text)
+                and len(self._word_starts) == len(self.words))
+    
+    def _edit_document(self, start: int, end: int, text: str) -> str:
+        """Replace ``[start, end)`` of the text editor and return the old text."""
+        cursor = QTextCursor(self.text_editor.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        old_text = cursor.selectedText()
+        with QSignalBlocker(self.text_editor):
+            cursor.insertText(text)
+        # Our own edit is already reflected in the spans
+        self._pending_change = None
+        self._synced_length += len(text) - (end - start)
+        return old_text
+    
+    def _shift_spans(self, first_row: int, delta: int):
+        """Move the spans of ``first_row`` and every later word by ``delta``."""
+        if delta:
+            self._word_starts[first_row:] = [v + delta for v in self._word_starts[first_row:]]
+            self._word_ends[first_row:] = [v + delta for v in self._word_ends[first_row:]]
+    
+    def _replace_word_text(self, row: int):
+        """Patch one word's span in the text editor instead of reloading the document."""
+        if not self._text_in_sync():
+            self._schedule_refresh()
             return
         
-        word = self.words[row]
+        start = self._word_starts[row]
+        end = self._word_ends[row]
+        new_text = self.words[row].text
+        self._edit_document(start, end, new_text)
         
-        try:
-            if col == 0:  # Text
-                word.text = item.text()
-            elif col == 1:  # Start time
-                word.start = float(item.text())
-            elif col == 2:  # End time
-                word.end = float(item.text())
-            elif col == 3:  # Confidence
-                word.confidence = float(item.text())
-            elif col == 4:  # Chord
-                word.chord = item.text() if item.text() else None
-            
-            # Update text editor
-            self.text_editor.blockSignals(True)
-            text = ' '.join(w.text for w in self.words)
-            self.text_editor.setPlainText(text)
-            self.text_editor.blockSignals(False)
-            
-            self.lyrics_changed.emit(self.words)
-            
-        except ValueError:
-            # Revert invalid input
-            self.update_table()
-            QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
+        self._word_ends[row] = start + len(new_text)
+        self._shift_spans(row + 1, len(new_text) - (end - start))
+    
+    def _insert_word_text(self, row: int):
+        """Insert the text of the new word at ``row`` into the text editor."""
+        text = self.words[row].text
+        if len(self.words) == 1:
+            self._edit_document(0, self._synced_length, text)
+            start = 0
+        elif row < len(self.words) - 1:
+            # Goes in front of the word that now follows it
+            start = self._word_starts[row]
+            self._edit_document(start, start, text + ' ')
+            self._shift_spans(row, len(text) + 1)
+        else:
+            start = self._word_ends[-1] + 1
+            self._edit_document(start - 1, start - 1, ' ' + text)
+        self._word_starts.insert(row, start)
+        self._word_ends.insert(row, start + len(text))
+    
+    def _remove_word_text(self, row: int):
+        """Remove the span of the deleted word at ``row`` with one adjacent gap."""
+        if len(self._word_starts) == 1:
+            start, end = 0, self._synced_length
+        elif row < len(self._word_starts) - 1:
+            start, end = self._word_starts[row], self._word_starts[row + 1]
+        else:
+            start, end = self._word_ends[row - 1], self._word_ends[row]
+        self._edit_document(start, end, '')
+        del self._word_starts[row]
+        del self._word_ends[row]
+        self._shift_spans(row, start - end)
+    
+    def _swap_word_text(self, row: int):
+        """Swap the text of the words at ``row`` and ``row + 1``, keeping the gap."""
+        start = self._word_starts[row]
+        end = self._word_ends[row + 1]
+        gap_start = self._word_ends[row] - start
+        gap_end = self._word_starts[row + 1] - start
+        # self.words is already swapped, the document is not yet
+        first = self.words[row].text
+        second = self.words[row + 1].text
+        cursor = QTextCursor(self.text_editor.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        gap = cursor.selectedText()[gap_start:gap_end]
+        self._edit_document(start, end, first + gap + second)
+        self._word_ends[row] = start + len(first)
+        self._word_starts[row + 1] = self._word_ends[row] + len(gap)
+    
+    def _update_word_count(self):
+        """Show the current number of words."""
+        self.word_count_label.setText(f"Words: {len(self.words)}")
     
     def add_word(self):
         """Add a new word."""
+        self._ensure_model()
         # Get current selection
-        current_row = self.word_table.currentRow()
+        current_row = self.word_table.currentIndex().row()
         if current_row < 0:
             current_row = len(self.words)
         
@@ -313,90 +824,93 @@ class LyricsEditor(QWidget):
         )
         
         # Insert word
-        self.words.insert(current_row, new_word)
-        self.update_display()
+        in_sync = self._text_in_sync()
+        self.word_model.insert_words(current_row, [new_word])
+        if in_sync:
+            self._insert_word_text(current_row)
+            self._update_word_count()
+        else:
+            self._schedule_refresh()
         
         # Select the new word
         self.word_table.selectRow(current_row)
         self.word_table.setFocus()
         
-        self.lyrics_changed.emit(self.words)
+        self.lyrics_changed.emit()
     
     def delete_word(self):
         """Delete the selected word."""
-        current_row = self.word_table.currentRow()
+        self._ensure_model()
+        current_row = self.word_table.currentIndex().row()
         if current_row >= 0 and current_row < len(self.words):
-            del self.words[current_row]
-            self.update_display()
-            self.lyrics_changed.emit(self.words)
+            in_sync = self._text_in_sync()
+            self.word_model.remove_words(current_row, current_row + 1)
+            if in_sync:
+                self._remove_word_text(current_row)
+                self._update_word_count()
+            else:
+                self._schedule_refresh()
+            self.lyrics_changed.emit()
     
     def move_word_up(self):
         """Move the selected word up."""
-        current_row = self.word_table.currentRow()
+        self._ensure_model()
+        current_row = self.word_table.currentIndex().row()
         if current_row > 0:
-            self.words[current_row], self.words[current_row - 1] = \
-                self.words[current_row - 1], self.words[current_row]
-            self.update_display()
+            in_sync = self._text_in_sync()
+            self.word_model.swap_words(current_row - 1)
+            if in_sync:
+                self._swap_word_text(current_row - 1)
+            else:
+                self._schedule_refresh()
             self.word_table.selectRow(current_row - 1)
-            self.lyrics_changed.emit(self.words)
+            self.lyrics_changed.emit()
     
     def move_word_down(self):
         """Move the selected word down."""
-        current_row = self.word_table.currentRow()
-        if current_row < len(self.words) - 1:
-            self.words[current_row], self.words[current_row + 1] = \
-                self.words[current_row + 1], self.words[current_row]
-            self.update_display()
+        self._ensure_model()
+        current_row = self.word_table.currentIndex().row()
+        if 0 <= current_row < len(self.words) - 1:
+            in_sync = self._text_in_sync()
+            self.word_model.swap_words(current_row)
+            if in_sync:
+                self._swap_word_text(current_row)
+            else:
+                self._schedule_refresh()
             self.word_table.selectRow(current_row + 1)
-            self.lyrics_changed.emit(self.words)
+            self.lyrics_changed.emit()
     
     def auto_align_timing(self):
         """Automatically align word timing."""
         if not self.words:
             return
         
+        self._ensure_model()
+        
         # Simple linear alignment
         total_duration = self.song_data.get_duration() if self.song_data else 60.0
         word_duration = total_duration / len(self.words)
         
-        for i, word in enumerate(self.words):
-            word.start = i * word_duration
-            word.end = (i + 1) * word_duration
-        
-        self.update_table()
-        self.lyrics_changed.emit(self.words)
+        # One multiply over the whole column instead of a per-word loop
+        starts = np.arange(len(self.words), dtype=np.float64) * word_duration
+        self.word_model.set_timings(starts, starts + word_duration)
+        self.lyrics_changed.emit()
         
-        QMessageBox.information(
-            self,
-            "Timing Aligned",
-            f"Aligned {len(self.words)} words over {total_duration:.1f} seconds."
-        )
+        self.show_status(f"Aligned {len(self.words)} words over {total_duration:.1f} seconds.")
     
     def fix_low_confidence(self):
         """Fix words with low confidence."""
-        fixed_count = 0
         threshold = 0.3
         
-        for word in self.words:
-            if word.confidence < threshold:
-                word.confidence = threshold
-                fixed_count += 1
+        self._ensure_model()
+        fixed_count = self.word_model.raise_confidences(threshold)
         
         if fixed_count > 0:
-            self.update_table()
-            self.lyrics_changed.emit(self.words)
+            self.lyrics_changed.emit()
             
-            QMessageBox.information(
-                self,
-                "Confidence Fixed",
-                f"Fixed confidence for {fixed_count} words."
-            )
+            self.show_status(f"Fixed confidence for {fixed_count} words.")
         else:
-            QMessageBox.information(
-                self,
-                "No Fixes Needed",
-                "All words have acceptable confidence levels."
-            )
+            self.show_status("All words have acceptable confidence levels.")
     
     def get_words(self) -> List[Word]:
         """Get the current word list."""
@@ -404,8 +918,7 @@ class LyricsEditor(QWidget):
     
     def set_words(self, words: List[Word]):
         """Set the word list."""
-        self.words = words.copy()
-        self.update_display()
+        self._load_words(words)
     
     def export_lyrics_text(self) -> str:
         """Export lyrics as plain text."""
@@ -415,18 +928,8 @@ class LyricsEditor(QWidget):
         """Import lyrics from plain text."""
         words = text.split()
         
-        # Create word objects with default timing
-        self.words = []
-        for i, word_text in enumerate(words):
-            start_time = i * 0.5
-            end_time = start_time + 0.5
-            word = Word(
-                text=word_text,
-                start=start_time,
-                end=end_time,
-                confidence=0.5
-            )
-            self.words.append(word)
-        
-        self.update_display()
-        self.lyrics_changed.emit(self.words)
+        with self.batch():
+            # Create word objects with default timing
+            self._load_words([self._new_word(word_text, i * 0.5)
+                              for i, word_text in enumerate(words)])
+            self._dirty = True
@@ -8,10 +8,19 @@ Main application window for Song Editor 3.
 import sys
 import os
 import logging
-import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+import numpy as np
+
+# Optional imports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QPushButton, QLabel, QFileDialog, QProgressBar, QTextEdit,
@@ -19,20 +28,24 @@ from PySide6.QtWidgets import (
     QSpinBox, QDoubleSpinBox, QLineEdit, QMessageBox, QStatusBar,
     QMenuBar, QMenu, QToolBar, QApplication, QFrame, QScrollArea
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSettings, QSize
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QSettings, QSize, QObject, QRunnable, QThreadPool,
+    QSignalBlocker, QElapsedTimer
+)
 from PySide6.QtGui import QIcon, QFont, QPixmap, QPalette, QColor, QAction
 
-from ..platform_utils import PlatformUtils, PlatformAwareWidget
-from .platform_styles import PlatformStyles
+from ..platform_utils import Platform, PlatformUtils, PlatformAwareWidget
+from .platform_styles import get_main_window_style, get_mobile_optimizations
 
 from ..core.audio_processor import AudioProcessor
-from ..core.transcriber import Transcriber
+from ..core.transcriber import Transcriber, BATCHED_WHISPER_AVAILABLE
 from ..core.chord_detector import ChordDetector
 from ..core.melody_extractor import MelodyExtractor
+from ..core.chord_assign import assign_chords
 from ..export.midi_exporter import MidiExporter
 from ..export.ccli_exporter import CCLIExporter
 from ..export.json_exporter import JSONExporter
-from ..models.song_data import SongData
+from ..models.song_data import SongData, Word, Chord, Note
 from ..models.metadata import Metadata, TranscriptionInfo, AudioProcessingInfo
 from .lyrics_editor import LyricsEditor
 from .enhanced_lyrics_editor import EnhancedLyricsEditor
@@ -40,25 +53,132 @@ from .chord_editor import ChordEditor
 from .melody_editor import MelodyEditor
 
 
-class ProcessingThread(QThread):
-    """Background thread for audio processing."""
+def _parse_song_data(raw: bytes) -> Dict[str, Any]:
+    """Parse the bytes of a .song_data file, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files written by the json module may contain NaN/Infinity,
+            # which orjson rejects
+            pass
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=8)
+def _read_song_data_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read and parse a .song_data file, caching the result for reopened files.
+    
+    mtime_ns and size are part of the cache key so a file changed on disk is
+    read again. The returned dict is shared and must not be modified;
+    SongData.from_dict builds fresh objects from it.
+    """
+    with open(path, 'rb') as f:
+        return _parse_song_data(f.read())
+
+
+class _SongDataLoaderSignals(QObject):
+    """Signals for _SongDataLoader; lives on the GUI thread."""
+    
+    loaded = Signal(str, str, object)  # audio path, .song_data path, SongData
+    failed = Signal(str, str)  # .song_data path, error message
+
+
+class _SongDataLoader(QRunnable):
+    """Look for and parse the .song_data file next to an audio file off the GUI thread."""
+    
+    def __init__(self, audio_file_path: str, signals: _SongDataLoaderSignals):
+        super().__init__()
+        self.audio_file_path = audio_file_path
+        self.signals = signals
+    
+    def run(self):
+        song_data_path = Path(self.audio_file_path).with_suffix('.song_data')
+        try:
+            stat = song_data_path.stat()
+        except FileNotFoundError:
+            return
+        try:
+            data = _read_song_data_file(str(song_data_path), stat.st_mtime_ns, stat.st_size)
+            song_data = SongData.from_dict(data)
+        except Exception as e:
+            self.signals.failed.emit(str(song_data_path), str(e))
+            return
+        self.signals.loaded.emit(self.audio_file_path, str(song_data_path), song_data)
+
+
+class _ExportSignals(QObject):
+    """Signals for _ExportRunnable; lives on the GUI thread."""
+    
+    finished = Signal(str, str, bool)  # export kind, output path, success
+
+
+class _ExportRunnable(QRunnable):
+    """Write song data with an exporter off the GUI thread."""
+    
+    def __init__(self, exporter, song_data: Dict[str, Any], output_path: str,
+                 kind: str, signals: _ExportSignals):
+        super().__init__()
+        self.exporter = exporter
+        self.song_data = song_data
+        self.output_path = output_path
+        self.kind = kind
+        self.signals = signals
+    
+    def run(self):
+        try:
+            success = self.exporter.export(self.song_data, self.output_path)
+        except Exception as e:
+            logging.error("Export to %s failed: %s", self.output_path, e)
+            success = False
+        self.signals.finished.emit(self.kind, self.output_path, success)
+
+
+class ProcessingSignals(QObject):
+    """Signals for ProcessingRunnable; lives on the GUI thread."""
     
     progress_updated = Signal(str, int)
     stage_completed = Signal(str, dict)
     processing_finished = Signal(dict)
     error_occurred = Signal(str)
+
+
+class ProcessingRunnable(QRunnable):
+    """Audio processing pipeline, run on the global thread pool.
+    
+    Pool threads are reused across runs instead of starting and tearing
+    down a QThread for every file processed.
+    """
     
     def __init__(self, audio_file: str, config: Dict[str, Any]):
         super().__init__()
+        # MainWindow keeps a reference; don't let the pool delete it under us
+        self.setAutoDelete(False)
+        self.signals = ProcessingSignals()
         self.audio_file = audio_file
         self.config = config
         self.song_data = None
         self.timeout_seconds = 1800  # 30 minute timeout for long audio files
-        self.start_time = None
+        # Monotonic, so elapsed times are immune to wall-clock adjustments
+        self._timer = QElapsedTimer()
+    
+    def _elapsed(self) -> float:
+        """Seconds since the pipeline started."""
+        return self._timer.elapsed() / 1000.0
+    
+    def _check_timeout(self, stage: str) -> float:
+        """Raise TimeoutError if the pipeline has run too long; returns the elapsed seconds."""
+        elapsed = self._elapsed()
+        if elapsed > self.timeout_seconds:
+            raise TimeoutError(
+                f"Processing timeout exceeded before {stage} ({elapsed:.1f}s > {self.timeout_seconds}s)"
+            )
+        return elapsed
     
     def run(self):
         """Run the audio processing pipeline."""
-        self.start_time = time.time()
+        self._timer.start()
+        audio_path = None
         try:
             # Initialize processors
             audio_processor = AudioProcessor(
@@ -66,20 +186,27 @@ class ProcessingThread(QThread):
                 save_intermediate=self.config.get('save_intermediate', True)
             )
             
-            # Determine appropriate model size based on selected model
-            selected_model = self.config.get('whisper_model', 'faster-whisper')
-            if selected_model == 'faster-whisper':
-                model_size = 'base'  # Use base for faster-whisper (fast and accurate)
-            elif selected_model == 'openai-whisper':
-                model_size = 'large-v2'  # Use large-v2 for openai-whisper (best accuracy)
-            else:
-                model_size = 'base'  # Default for other models
+            # Words from an earlier run of this file, when the user chose to reuse them
+            cached_words = self.config.get('cached_words')
             
-            transcriber = Transcriber(
-                model=selected_model,
-                model_size=model_size,
-                language=self.config.get('language', None)  # None for auto-detection
-            )
+            transcriber = None
+            if cached_words is None:
+                # Determine appropriate model size based on selected model
+                selected_model = self.config.get('whisper_model', 'faster-whisper')
+                if selected_model == 'faster-whisper':
+                    model_size = 'base'  # Use base for faster-whisper (fast and accurate)
+                elif selected_model == 'openai-whisper':
+                    model_size = 'large-v2'  # Use large-v2 for openai-whisper (best accuracy)
+                else:
+                    model_size = 'base'  # Default for other models
+                
+                transcriber = Transcriber(
+                    model=selected_model,
+                    model_size=model_size,
+                    language=self.config.get('language', None),  # None for auto-detection
+                    compute_type=self.config.get('compute_type', 'float32'),
+                    batch_size=self.config.get('batch_size', 1)
+                )
             
             chord_detector = ChordDetector(
                 use_chordino=self.config.get('use_chordino', True),
@@ -93,73 +220,96 @@ class ProcessingThread(QThread):
             )
             
             # Process audio
-            self.progress_updated.emit("Loading audio...", 10)
-            logging.info(f"Processing audio file: {self.audio_file}")
+            self.signals.progress_updated.emit("Loading audio...", 10)
+            logging.info("Processing audio file: %s", self.audio_file)
             audio_data = audio_processor.process(self.audio_file)
             
             # Calculate audio duration and estimated processing time
             audio_duration = len(audio_data['audio']) / audio_data['sample_rate']
             estimated_transcription_time = audio_duration * 0.3  # Rough estimate: 30% of audio duration
             
-            logging.info(f"Audio loaded: {len(audio_data['audio'])} samples at {audio_data['sample_rate']} Hz")
-            logging.info(f"Audio duration: {audio_duration:.1f} seconds")
-            logging.info(f"Estimated transcription time: {estimated_transcription_time:.1f} seconds")
+            logging.info("Audio loaded: %d samples at %s Hz", len(audio_data['audio']), audio_data['sample_rate'])
+            logging.info("Audio duration: %.1f seconds", audio_duration)
+            logging.info("Estimated transcription time: %.1f seconds", estimated_transcription_time)
             
             if audio_duration > 300:  # 5 minutes
-                logging.warning(f"Long audio file detected ({audio_duration:.1f}s) - transcription may take several minutes")
-                self.progress_updated.emit(f"Long audio file ({audio_duration:.0f}s) - this may take a while", 25)
+                logging.warning("Long audio file detected (%.1fs) - transcription may take several minutes", audio_duration)
+                self.signals.progress_updated.emit(f"Long audio file ({audio_duration:.0f}s) - this may take a while", 25)
                 
                 # For very long files, suggest using a smaller model
                 if audio_duration > 600:  # 10 minutes
-                    logging.warning(f"Very long audio file ({audio_duration:.1f}s) - consider using 'tiny' model for faster processing")
-                    self.progress_updated.emit(f"Very long file - using 'tiny' model for speed", 26)
-            
-            self.progress_updated.emit("Transcribing lyrics... (this may take several minutes)", 30)
-            logging.info("Starting transcription...")
-            
-            # Check for timeout before starting transcription
-            elapsed_so_far = time.time() - self.start_time
-            if elapsed_so_far > self.timeout_seconds:
-                raise TimeoutError(f"Processing timeout exceeded ({elapsed_so_far:.1f}s > {self.timeout_seconds}s)")
-            
-            logging.info(f"Starting transcription after {elapsed_so_far:.1f}s of processing")
-            
-            # Simple progress update during transcription
-            transcription_start = time.time()
-            
-            # Simple transcription without signal-based timeout (signals don't work in background threads)
-            words = transcriber.transcribe(audio_data['audio'], audio_data['sample_rate'])
-            transcription_elapsed = time.time() - transcription_start
-            logging.info(f"Transcription completed: {len(words)} words found in {transcription_elapsed:.2f}s")
-            
-            # Update progress after transcription
-            elapsed = time.time() - self.start_time
-            logging.info(f"Total processing time so far: {elapsed:.2f} seconds")
-            self.progress_updated.emit(f"Transcription completed ({transcription_elapsed:.1f}s)", 40)
-            
-            self.progress_updated.emit("Detecting chords...", 50)
+                    logging.warning("Very long audio file (%.1fs) - consider using 'tiny' model for faster processing", audio_duration)
+                    self.signals.progress_updated.emit(f"Very long file - using 'tiny' model for speed", 26)
             
-            # Check for timeout before chord detection
-            elapsed_so_far = time.time() - self.start_time
-            if elapsed_so_far > self.timeout_seconds:
-                raise TimeoutError(f"Processing timeout exceeded ({elapsed_so_far:.1f}s > {self.timeout_seconds}s)")
+            # Whisper, Chordino and Basic Pitch all read audio from disk; write the
+            # processed audio once and share it instead of each encoding a copy
+            if (transcriber is not None or chord_detector.use_chordino
+                    or melody_extractor.use_basic_pitch):
+                audio_path = audio_processor.save_temp_audio(audio_data['audio'], audio_data['sample_rate'])
             
-            chords = chord_detector.detect(audio_data['audio'], audio_data['sample_rate'])
-            
-            self.progress_updated.emit("Extracting melody...", 70)
-            
-            # Check for timeout before melody extraction
-            elapsed_so_far = time.time() - self.start_time
-            if elapsed_so_far > self.timeout_seconds:
-                raise TimeoutError(f"Processing timeout exceeded ({elapsed_so_far:.1f}s > {self.timeout_seconds}s)")
+            if cached_words is not None:
+                # The transcriber (and its model) was never loaded
+                words = cached_words
+                logging.info("Reusing existing transcription: %d words", len(words))
+                self.signals.progress_updated.emit("Reusing existing transcription", 40)
+            else:
+                self.signals.progress_updated.emit("Transcribing lyrics... (this may take several minutes)", 30)
+                logging.info("Starting transcription...")
+                
+                elapsed_so_far = self._check_timeout("transcription")
+                logging.info("Starting transcription after %.1fs of processing", elapsed_so_far)
+                
+                # Simple progress update during transcription
+                transcription_timer = QElapsedTimer()
+                transcription_timer.start()
+                
+                # Simple transcription without signal-based timeout (signals don't work in background threads)
+                words = transcriber.transcribe(audio_data['audio'], audio_data['sample_rate'], audio_path)
+                transcription_elapsed = transcription_timer.elapsed() / 1000.0
+                logging.info("Transcription completed: %d words found in %.2fs", len(words), transcription_elapsed)
+                
+                # Update progress after transcription
+                logging.info("Total processing time so far: %.2f seconds", self._elapsed())
+                self.signals.progress_updated.emit(f"Transcription completed ({transcription_elapsed:.1f}s)", 40)
             
-            notes = melody_extractor.extract(audio_data['audio'], audio_data['sample_rate'])
+            if self.config.get('parallel_analysis', True):
+                # Chords and melody read the same audio and don't depend on each
+                # other; their native backends release the GIL, so run both at once
+                self.signals.progress_updated.emit("Detecting chords and extracting melody...", 50)
+                
+                self._check_timeout("chord detection")
+                
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    chords_future = pool.submit(
+                        chord_detector.detect, audio_data['audio'], audio_data['sample_rate'], audio_path
+                    )
+                    notes_future = pool.submit(
+                        melody_extractor.extract, audio_data['audio'], audio_data['sample_rate'], audio_path
+                    )
+                    chords = chords_future.result()
+                    self.signals.progress_updated.emit("Chords detected, extracting melody...", 70)
+                    notes = notes_future.result()
+            else:
+                self.signals.progress_updated.emit("Detecting chords...", 50)
+                
+                self._check_timeout("chord detection")
+                
+                chords = chord_detector.detect(audio_data['audio'], audio_data['sample_rate'], audio_path)
+                
+                self.signals.progress_updated.emit("Extracting melody...", 70)
+                
+                self._check_timeout("melody extraction")
+                
+                notes = melody_extractor.extract(audio_data['audio'], audio_data['sample_rate'], audio_path)
             
-            self.progress_updated.emit("Finalizing...", 90)
+            self.signals.progress_updated.emit("Finalizing...", 90)
             
             # Create song data
             # Convert dictionary to proper objects
-            transcription_info = TranscriptionInfo.from_dict(transcriber.get_model_info())
+            if transcriber is not None:
+                transcription_info = TranscriptionInfo.from_dict(transcriber.get_model_info())
+            else:
+                transcription_info = TranscriptionInfo.from_dict(self.config.get('cached_transcription') or {})
             audio_processing_info = AudioProcessingInfo.from_dict(audio_processor.get_processing_info())
             
             metadata = Metadata(
@@ -169,11 +319,9 @@ class ProcessingThread(QThread):
             )
             
             # Convert dictionaries to proper objects
-            from ..models.song_data import Word, Chord, Note
-            
-            word_objects = [Word.from_dict(word) for word in words]
-            chord_objects = [Chord.from_dict(chord) for chord in chords]
-            note_objects = [Note.from_dict(note) for note in notes]
+            word_objects = list(map(Word.from_dict, words))
+            chord_objects = list(map(Chord.from_dict, chords))
+            note_objects = list(map(Note.from_dict, notes))
             
             # Associate chords with words based on timing
             self._associate_chords_with_words(word_objects, chord_objects)
@@ -185,50 +333,93 @@ class ProcessingThread(QThread):
                 notes=note_objects
             )
             
-            self.progress_updated.emit("Processing complete!", 100)
-            self.processing_finished.emit(self.song_data.to_dict())
+            self.signals.progress_updated.emit("Processing complete!", 100)
+            self.signals.processing_finished.emit(self.song_data.to_dict())
             
         except Exception as e:
-            logging.error(f"Processing error: {e}")
-            self.error_occurred.emit(str(e))
+            logging.error("Processing error: %s", e)
+            self.signals.error_occurred.emit(str(e))
+        finally:
+            if audio_path is not None and os.path.exists(audio_path):
+                os.unlink(audio_path)
     
-    def _associate_chords_with_words(self, words, chords):
+    def _associate_chords_with_words(self, words: List[Word], chords: List[Chord]):
         """Associate detected chords with words based on timing overlap."""
         if not chords:
             return
         
-        for word in words:
-            word_mid_time = (word.start + word.end) / 2.0
-            
-            # Find the chord that overlaps with this word's timing
-            best_chord = None
-            best_overlap = 0.0
-            
-            for chord in chords:
-                chord_start = chord.start if hasattr(chord, 'start') else 0.0
-                chord_end = chord.end if hasattr(chord, 'end') else 0.0
-                
-                # Check if chord overlaps with word
-                if chord_start <= word_mid_time <= chord_end:
-                    overlap = min(word.end, chord_end) - max(word.start, chord_start)
-                    if overlap > best_overlap:
-                        best_overlap = overlap
-                        best_chord = chord
-            
-            # Assign the best matching chord to the word
-            if best_chord:
-                if hasattr(best_chord, 'symbol'):
-                    word.chord = best_chord.symbol
-                elif hasattr(best_chord, 'name'):
-                    word.chord = best_chord.name
-                else:
-                    word.chord = str(best_chord)
-                logging.debug(f"Associated chord {word.chord} with word '{word.text}' at {word_mid_time:.2f}s")
+        chord_symbols = [c.symbol for c in chords]
+        
+        n_words = len(words)
+        n_chords = len(chords)
+        ws = np.fromiter((w.start for w in words), dtype=np.float64, count=n_words)
+        we = np.fromiter((w.end for w in words), dtype=np.float64, count=n_words)
+        cs = np.fromiter((c.start for c in chords), dtype=np.float64, count=n_chords)
+        ce = np.fromiter((c.end for c in chords), dtype=np.float64, count=n_chords)
+        # Chords without length have no overlap to win with, and would hide a
+        # neighbour from the search when they share its boundary
+        keep = ce > cs
+        if not keep.all():
+            cs = cs[keep]
+            ce = ce[keep]
+            chord_symbols = [symbol for symbol, k in zip(chord_symbols, keep.tolist()) if k]
+            if not chord_symbols:
+                return
+        # Detectors emit chords in time order, so the sort and the gathered
+        # copies are usually unnecessary
+        if np.any(cs[1:] < cs[:-1]):
+            order = np.argsort(cs, kind='stable')
+            cs = cs[order]
+            ce = ce[order]
+            chord_symbols = [chord_symbols[k] for k in order.tolist()]
+        
+        # Plain ints, so the loop below doesn't box a NumPy scalar per word
+        best = assign_chords(ws, we, cs, ce).tolist()
+        
+        # Checked once so the per-word message isn't built when debug is off
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for i, chord_index in enumerate(best):
+            if chord_index < 0:
+                continue
+            word = words[i]
+            word.chord = chord_symbols[chord_index]
+            if debug_enabled:
+                logging.debug("Associated chord %s with word '%s' at %.2fs",
+                              word.chord, word.text, (word.start + word.end) / 2.0)
 
 
 class MainWindow(QMainWindow):
     """Main application window with platform-aware design."""
     
+    # Emitted with the new SongData; every editor is connected once when built
+    song_data_changed = Signal(object)
+    
+    _ABOUT_TEXT = (
+        "Song Editor 3\n\n"
+        "A comprehensive audio processing and song analysis tool.\n\n"
+        "Features:\n"
+        "• Audio transcription with multiple Whisper models\n"
+        "• Chord detection with Chordino\n"
+        "• Melody extraction with Basic Pitch/CREPE\n"
+        "• Source separation with Demucs\n"
+        "• Export to MIDI, CCLI, and JSON formats\n\n"
+        "Version 3.0.0"
+    )
+    
+    # Minimum time between progress bar/status bar updates
+    PROGRESS_INTERVAL_MS = 50
+    
+    # Auto-save requests closer together than this write only once
+    AUTOSAVE_DELAY_MS = 500
+    
+    # Export kind -> (status message on success, error title, error text)
+    _EXPORT_MESSAGES = {
+        'save': ("Saved: {}", "Save Error", "Failed to save song data."),
+        'midi': ("Exported MIDI: {}", "Export Error", "Failed to export MIDI."),
+        'ccli': ("Exported CCLI: {}", "Export Error", "Failed to export CCLI."),
+        'json': ("Exported JSON: {}", "Export Error", "Failed to export JSON."),
+    }
+    
     def __init__(self):
         super().__init__()
         
@@ -236,10 +427,66 @@ class MainWindow(QMainWindow):
         self.platform_utils = PlatformUtils()
         self.platform_aware = PlatformAwareWidget()
         
+        self.audio_file_path = None
+        # The .song_data file next to audio_file_path; set together with it
+        self._song_data_path: Optional[str] = None
         self.song_data = None
-        self.processing_thread = None
+        # Audio file that self.song_data was transcribed from
+        self._song_data_audio_path = None
+        self.processing_runnable = None
         self.settings = QSettings('SongEditor3', 'SongEditor3')
         
+        # Existing .song_data files are read on the thread pool
+        self._song_data_signals = _SongDataLoaderSignals(self)
+        self._song_data_signals.loaded.connect(self._on_song_data_loaded)
+        self._song_data_signals.failed.connect(self._on_song_data_failed)
+        
+        # Saves and exports are written on the thread pool too. The exporters
+        # hold only their options, so one instance of each can serve every
+        # export, including ones running concurrently
+        self._export_signals = _ExportSignals(self)
+        self._export_signals.finished.connect(self._on_export_finished)
+        self._json_exporter = JSONExporter()
+        self._midi_exporter = MidiExporter()
+        self._ccli_exporter = CCLIExporter()
+        
+        # Auto-saves are coalesced; the latest request wins. _dirty tracks
+        # changes not yet written to the .song_data file
+        self._dirty = False
+        self._autosave_target = None
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.timeout.connect(self._do_autosave)
+        
+        # Progress updates from the worker are applied at a limited rate
+        self._pending_progress = None
+        self._progress_clock = QElapsedTimer()
+        self._progress_clock.start()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Qt's own file dialog where the native one is unavailable or slow:
+        # mobile platforms, and Linux sessions without a desktop environment,
+        # where there's no native dialog provider to hand off to
+        if not self.platform_utils.should_use_native_dialogs() or (
+                self.platform_utils.detect_platform() == Platform.LINUX
+                and not os.environ.get('XDG_CURRENT_DESKTOP', '')):
+            self._file_dialog_options = QFileDialog.DontUseNativeDialog
+        else:
+            self._file_dialog_options = QFileDialog.Options()
+        
+        # Built on first use and reused afterwards
+        self._save_dialog = None
+        self._about_box = None
+        
+        # Editors are built lazily with their tabs; the menu sets save_action
+        self.basic_lyrics_editor = None
+        self.enhanced_lyrics_editor = None
+        self.chord_editor = None
+        self.melody_editor = None
+        self.save_action = None
+        
         # Platform-specific setup
         self.setup_platform_specific_behavior()
         self.init_ui()
@@ -255,7 +502,7 @@ class MainWindow(QMainWindow):
         self.resize(width, height)
         
         # Apply platform-specific stylesheet
-        self.setStyleSheet(PlatformStyles.get_main_window_style())
+        self.setStyleSheet(get_main_window_style())
         
         # Platform-specific window flags
         if self.platform_utils.is_mobile():
@@ -271,7 +518,7 @@ class MainWindow(QMainWindow):
     def init_ui(self):
         """Initialize the user interface with platform-aware design."""
         # Get platform-specific optimizations
-        mobile_opts = PlatformStyles.get_mobile_optimizations()
+        mobile_opts = get_mobile_optimizations()
         
         # Create central widget
         central_widget = QWidget()
@@ -279,12 +526,12 @@ class MainWindow(QMainWindow):
         
         # Create main layout with platform-specific spacing
         main_layout = QVBoxLayout(central_widget)
-        main_layout.setSpacing(mobile_opts["spacing"])
+        main_layout.setSpacing(mobile_opts.spacing)
         main_layout.setContentsMargins(
-            mobile_opts["safe_area_margin"],
-            mobile_opts["safe_area_margin"],
-            mobile_opts["safe_area_margin"],
-            mobile_opts["safe_area_margin"]
+            mobile_opts.safe_area_margin,
+            mobile_opts.safe_area_margin,
+            mobile_opts.safe_area_margin,
+            mobile_opts.safe_area_margin
         )
         
         # Create menu bar (minimal for mobile)
@@ -330,10 +577,7 @@ class MainWindow(QMainWindow):
         scroll_layout.addWidget(controls_panel)
         
         # Add tab widget for editors
-        self.tab_widget = QTabWidget()
-        self.tab_widget.addTab(self.create_lyrics_editor(), "Lyrics")
-        self.tab_widget.addTab(self.create_chord_editor(), "Chords")
-        self.tab_widget.addTab(self.create_melody_editor(), "Melody")
+        self.create_editor_tabs()
         scroll_layout.addWidget(self.tab_widget)
         
         scroll_area.setWidget(scroll_content)
@@ -356,6 +600,13 @@ class MainWindow(QMainWindow):
         # Set splitter proportions
         main_splitter.setSizes([300, 900])
     
+    def _make_file_label(self) -> QLabel:
+        """Create the label showing the selected audio file, shared by both layouts."""
+        text = Path(self.audio_file_path).name if self.audio_file_path else "No file selected"
+        label = QLabel(text)
+        label.setWordWrap(True)
+        return label
+    
     def create_mobile_controls_panel(self):
         """Create mobile-optimized controls panel."""
         panel = QGroupBox("Audio Processing")
@@ -364,8 +615,7 @@ class MainWindow(QMainWindow):
         
         # File selection
         file_layout = QHBoxLayout()
-        self.file_label = QLabel("No file selected")
-        self.file_label.setWordWrap(True)
+        self.file_label = self._make_file_label()
         file_layout.addWidget(self.file_label)
         
         select_button = QPushButton("Select Audio")
@@ -404,37 +654,77 @@ class MainWindow(QMainWindow):
         
         return panel
     
+    def create_editor_tabs(self):
+        """Create the editor tab widget; each editor is built when its tab is first shown."""
+        self.tab_widget = QTabWidget()
+        
+        # Tabs start as empty placeholders
+        self._tab_factories = {
+            0: self.create_lyrics_editor,
+            1: self.create_chord_editor,
+            2: self.create_melody_editor,
+        }
+        for label in ("Lyrics", "Chords", "Melody"):
+            self.tab_widget.addTab(QWidget(), label)
+        
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tab_widget.currentIndex())
+    
+    def _ensure_tab(self, index: int):
+        """Replace the placeholder at ``index`` with its editor the first time it is shown."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        
+        label = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        with QSignalBlocker(self.tab_widget):
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, factory(), label)
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
     def create_lyrics_editor(self):
         """Create lyrics editor widget with toggle for enhanced mode."""
-        from .lyrics_editor import LyricsEditor
-        from .enhanced_lyrics_editor import EnhancedLyricsEditor
-        
         # Create a container widget
         container = QWidget()
-        layout = QVBoxLayout(container)
+        self.lyrics_editor_layout = QVBoxLayout(container)
         
         # Create toggle button
         self.enhanced_mode_toggle = QPushButton("🔧 Switch to Enhanced Mode")
         self.enhanced_mode_toggle.setCheckable(True)
         self.enhanced_mode_toggle.toggled.connect(self.toggle_lyrics_editor_mode)
-        layout.addWidget(self.enhanced_mode_toggle)
+        self.lyrics_editor_layout.addWidget(self.enhanced_mode_toggle)
         
-        # Create both editors
+        # Start with the basic editor; the enhanced one is built on first toggle
         self.basic_lyrics_editor = LyricsEditor()
-        self.enhanced_lyrics_editor = EnhancedLyricsEditor()
-        
-        # Start with basic editor visible
-        self.basic_lyrics_editor.show()
-        self.enhanced_lyrics_editor.hide()
-        
-        layout.addWidget(self.basic_lyrics_editor)
-        layout.addWidget(self.enhanced_lyrics_editor)
+        self.basic_lyrics_editor.lyrics_changed.connect(self._on_lyrics_edited)
+        self.song_data_changed.connect(self.basic_lyrics_editor.set_song_data)
+        if self.song_data:
+            self.basic_lyrics_editor.set_song_data(self.song_data)
+        self.lyrics_editor_layout.addWidget(self.basic_lyrics_editor)
         
+        self.lyrics_editor_container = container
         return container
     
+    def _create_enhanced_lyrics_editor(self):
+        """Build the enhanced lyrics editor and bring it up to date."""
+        # Its edits stay in the editor and never reach song_data, so there
+        # is nothing for it to mark dirty
+        self.enhanced_lyrics_editor = EnhancedLyricsEditor()
+        self.song_data_changed.connect(self.enhanced_lyrics_editor.set_song_data)
+        self.enhanced_lyrics_editor.hide()
+        if self.song_data:
+            self.enhanced_lyrics_editor.set_song_data(self.song_data)
+        if self.audio_file_path:
+            self.enhanced_lyrics_editor.set_audio_path(self.audio_file_path)
+        self.lyrics_editor_layout.addWidget(self.enhanced_lyrics_editor)
+    
     def toggle_lyrics_editor_mode(self, enhanced_mode: bool):
         """Toggle between basic and enhanced lyrics editor modes."""
         if enhanced_mode:
+            if self.enhanced_lyrics_editor is None:
+                self._create_enhanced_lyrics_editor()
             self.basic_lyrics_editor.hide()
             self.enhanced_lyrics_editor.show()
             self.enhanced_mode_toggle.setText("🔧 Switch to Basic Mode")
@@ -455,13 +745,45 @@ class MainWindow(QMainWindow):
     
     def create_chord_editor(self):
         """Create chord editor widget."""
-        from .chord_editor import ChordEditor
-        return ChordEditor()
+        self.chord_editor = ChordEditor()
+        self.chord_editor.chords_changed.connect(self._on_chords_edited)
+        self.song_data_changed.connect(self.chord_editor.set_song_data)
+        if self.song_data:
+            self.chord_editor.set_song_data(self.song_data)
+        return self.chord_editor
     
     def create_melody_editor(self):
         """Create melody editor widget."""
-        from .melody_editor import MelodyEditor
-        return MelodyEditor()
+        self.melody_editor = MelodyEditor()
+        self.melody_editor.melody_changed.connect(self._on_melody_edited)
+        self.song_data_changed.connect(self.melody_editor.set_song_data)
+        if self.song_data:
+            self.melody_editor.set_song_data(self.song_data)
+        return self.melody_editor
+    
+    def _on_lyrics_edited(self):
+        """Copy the lyrics editor's words into the song data."""
+        if self.song_data is not None:
+            self.song_data.words = self.basic_lyrics_editor.get_words()
+            self._mark_song_data_dirty()
+    
+    def _on_chords_edited(self, *args):
+        """Copy the chord editor's chords into the song data."""
+        if self.song_data is not None:
+            self.song_data.chords = self.chord_editor.get_chords()
+            self._mark_song_data_dirty()
+    
+    def _on_melody_edited(self):
+        """Copy the melody editor's notes into the song data."""
+        if self.song_data is not None:
+            self.song_data.notes = self.melody_editor.get_notes()
+            self._mark_song_data_dirty()
+    
+    def _mark_song_data_dirty(self):
+        """Record an editor change; it is written out by the next save."""
+        if self.song_data is not None:
+            self.song_data.mark_dirty()
+            self._dirty = True
     
     def create_menu_bar(self):
         """Create the menu bar."""
@@ -479,6 +801,7 @@ class MainWindow(QMainWindow):
         save_action.setShortcut('Ctrl+S')
         save_action.triggered.connect(self.save_song_data)
         file_menu.addAction(save_action)
+        self.save_action = save_action
         
         export_menu = file_menu.addMenu('&Export')
         
@@ -558,8 +881,7 @@ class MainWindow(QMainWindow):
         file_group = QGroupBox("File Information")
         file_layout = QGridLayout(file_group)
         
-        self.file_label = QLabel("No file selected")
-        self.file_label.setWordWrap(True)
+        self.file_label = self._make_file_label()
         file_layout.addWidget(QLabel("Audio File:"), 0, 0)
         file_layout.addWidget(self.file_label, 0, 1)
         
@@ -576,30 +898,58 @@ class MainWindow(QMainWindow):
         # Whisper model
         self.whisper_model_combo = QComboBox()
         self.whisper_model_combo.addItems(['openai-whisper', 'faster-whisper', 'whisperx', 'mlx-whisper'])
+        self._whisper_model_index = self._combo_index(self.whisper_model_combo)
         options_layout.addWidget(QLabel("Whisper Model:"), 0, 0)
         options_layout.addWidget(self.whisper_model_combo, 0, 1)
         
         # Chord detection method
         self.chord_method_combo = QComboBox()
         self.chord_method_combo.addItems(['chordino', 'chromagram'])
+        self._chord_method_index = self._combo_index(self.chord_method_combo)
         options_layout.addWidget(QLabel("Chord Detection:"), 1, 0)
         options_layout.addWidget(self.chord_method_combo, 1, 1)
         
         # Melody extraction method
         self.melody_method_combo = QComboBox()
         self.melody_method_combo.addItems(['basic-pitch', 'crepe'])
+        self._melody_method_index = self._combo_index(self.melody_method_combo)
         options_layout.addWidget(QLabel("Melody Extraction:"), 2, 0)
         options_layout.addWidget(self.melody_method_combo, 2, 1)
         
+        # Faster Whisper (CTranslate2) precision; int8 is much faster on CPU
+        self.compute_type_combo = QComboBox()
+        self.compute_type_combo.addItems(['float32', 'float16', 'int8', 'int8_float16'])
+        self._compute_type_index = self._combo_index(self.compute_type_combo)
+        options_layout.addWidget(QLabel("Compute Type:"), 3, 0)
+        options_layout.addWidget(self.compute_type_combo, 3, 1)
+        
+        # Faster Whisper batched inference; 1 transcribes sequentially
+        self.batch_size_spin = QSpinBox()
+        self.batch_size_spin.setRange(1, 64)
+        self.batch_size_spin.setValue(1)
+        batch_size_label = QLabel("Batch Size:")
+        options_layout.addWidget(batch_size_label, 4, 0)
+        options_layout.addWidget(self.batch_size_spin, 4, 1)
+        if not BATCHED_WHISPER_AVAILABLE:
+            # Installed faster-whisper predates BatchedInferencePipeline
+            self.batch_size_spin.setEnabled(False)
+            batch_size_label.hide()
+            self.batch_size_spin.hide()
+        
         # Use Demucs
         self.use_demucs_check = QCheckBox("Use Demucs (Source Separation)")
         self.use_demucs_check.setChecked(True)
-        options_layout.addWidget(self.use_demucs_check, 3, 0, 1, 2)
+        options_layout.addWidget(self.use_demucs_check, 5, 0, 1, 2)
         
         # Save intermediate files
         self.save_intermediate_check = QCheckBox("Save Intermediate Files")
         self.save_intermediate_check.setChecked(True)
-        options_layout.addWidget(self.save_intermediate_check, 4, 0, 1, 2)
+        options_layout.addWidget(self.save_intermediate_check, 6, 0, 1, 2)
+        
+        # Run chord and melody detection concurrently (uses more memory)
+        self.parallel_analysis_check = QCheckBox("Parallel Chord/Melody Analysis")
+        self.parallel_analysis_check.setChecked(True)
+        options_layout.addWidget(self.parallel_analysis_check, 7, 0, 1, 2)
         
         layout.addWidget(options_group)
         
@@ -653,47 +1003,24 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(panel)
         
         # Create tab widget
-        self.tab_widget = QTabWidget()
-        
-        # Lyrics editor tab with enhanced toggle
-        self.lyrics_editor_container = self.create_lyrics_editor()
-        self.tab_widget.addTab(self.lyrics_editor_container, "Lyrics")
-        
-        # Chord editor tab
-        self.chord_editor = ChordEditor()
-        self.tab_widget.addTab(self.chord_editor, "Chords")
-        
-        # Melody editor tab
-        self.melody_editor = MelodyEditor()
-        self.tab_widget.addTab(self.melody_editor, "Melody")
-        
+        self.create_editor_tabs()
         layout.addWidget(self.tab_widget)
         
         return panel
     
     def open_audio_file(self):
         """Open an audio file for processing with platform-aware dialog."""
-        # Use platform-specific file dialog options
-        if self.platform_utils.should_use_native_dialogs():
-            # Use native file dialog
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "Open Audio File",
-                "",
-                "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.aac *.opus);;All Files (*)"
-            )
-        else:
-            # Use custom file dialog for mobile platforms
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "Select Audio File",
-                "",
-                "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.aac *.opus);;All Files (*)",
-                options=QFileDialog.DontUseNativeDialog
-            )
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Open Audio File" if self.platform_utils.should_use_native_dialogs() else "Select Audio File",
+            "",
+            "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.aac *.opus);;All Files (*)",
+            options=self._file_dialog_options
+        )
         
         if file_path:
             self.audio_file_path = file_path
+            self._song_data_path = str(Path(file_path).with_suffix('.song_data'))
             self.file_label.setText(Path(file_path).name)
             self.process_btn.setEnabled(True)
             self.status_bar.showMessage(f"Loaded: {Path(file_path).name}")
@@ -702,60 +1029,66 @@ class MainWindow(QMainWindow):
             self.check_and_load_existing_song_data(file_path)
     
     def check_and_load_existing_song_data(self, audio_file_path: str):
-        """Check for and load existing .song_data file associated with the audio file."""
-        from pathlib import Path
-        import os
-        
-        # Get the base name without extension and add .song_data
-        audio_path = Path(audio_file_path)
-        song_data_path = audio_path.with_suffix('.song_data')
-        
-        if song_data_path.exists():
-            try:
-                # Import the necessary modules
-                from ..export.json_exporter import JSONExporter
-                from ..models.song_data import SongData
-                
-                # Load the existing song data
-                with open(song_data_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Create SongData object from the loaded data
-                self.song_data = SongData.from_dict(data)
-                
-                # Populate the editors with the existing data
-                if hasattr(self, 'basic_lyrics_editor') and self.basic_lyrics_editor:
-                    self.basic_lyrics_editor.set_song_data(self.song_data)
-                
-                if hasattr(self, 'enhanced_lyrics_editor') and self.enhanced_lyrics_editor:
-                    self.enhanced_lyrics_editor.set_song_data(self.song_data)
-                    self.enhanced_lyrics_editor.set_audio_path(audio_file_path)
-                
-                if hasattr(self, 'chord_editor') and self.chord_editor:
-                    self.chord_editor.set_song_data(self.song_data)
-                
-                if hasattr(self, 'melody_editor') and self.melody_editor:
-                    self.melody_editor.set_song_data(self.song_data)
-                
-                # Update status
-                self.status_bar.showMessage(f"Loaded existing song data: {song_data_path.name}")
-                
-                # Enable save functionality
-                if hasattr(self, 'save_action'):
-                    self.save_action.setEnabled(True)
-                
-                # Auto-save to ensure the data is preserved with any updates
-                self.save_song_data_auto()
-                
-                logging.info(f"Successfully loaded existing song data from {song_data_path}")
-                
-            except Exception as e:
-                logging.error(f"Failed to load existing song data from {song_data_path}: {e}")
-                self.status_bar.showMessage(f"Failed to load song data: {e}")
+        """Check for and load existing .song_data file associated with the audio file.
+        
+        The lookup and parse run on the global thread pool; the editors are
+        populated from _on_song_data_loaded once the data arrives.
+        """
+        QThreadPool.globalInstance().start(
+            _SongDataLoader(audio_file_path, self._song_data_signals)
+        )
+    
+    def _on_song_data_loaded(self, audio_file_path: str, song_data_path: str, song_data: SongData):
+        """Populate the editors with song data loaded by _SongDataLoader."""
+        # Ignore results for a file the user has since moved away from
+        if audio_file_path != self.audio_file_path:
+            return
+        
+        # Edits to the previous song still waiting to be auto-saved go out first
+        if self._autosave_timer.isActive():
+            self._autosave_timer.stop()
+            self._do_autosave()
+        
+        try:
+            self.song_data = song_data
+            self._song_data_audio_path = audio_file_path
+            
+            # Populate the editors with the existing data
+            self._broadcast_song_data()
+            # Matches the file on disk; editors reporting the load as a change don't count
+            self._dirty = False
+            
+            # Update status
+            self.status_bar.showMessage(f"Loaded existing song data: {Path(song_data_path).name}")
+            
+            # Enable save functionality
+            if self.save_action is not None:
+                self.save_action.setEnabled(True)
+            
+            logging.info(f"Successfully loaded existing song data from {song_data_path}")
+            
+        except Exception as e:
+            self._on_song_data_failed(song_data_path, str(e))
+    
+    def _broadcast_song_data(self):
+        """Hand self.song_data to every built editor, repainting once at the end."""
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        try:
+            self.song_data_changed.emit(self.song_data)
+            if self.enhanced_lyrics_editor is not None and self.audio_file_path:
+                self.enhanced_lyrics_editor.set_audio_path(self.audio_file_path)
+        finally:
+            central_widget.setUpdatesEnabled(True)
+    
+    def _on_song_data_failed(self, song_data_path: str, error: str):
+        """Report a .song_data file that could not be loaded."""
+        logging.error(f"Failed to load existing song data from {song_data_path}: {error}")
+        self.status_bar.showMessage(f"Failed to load song data: {error}")
     
     def process_audio(self):
         """Process the loaded audio file."""
-        if not hasattr(self, 'audio_file_path'):
+        if self.audio_file_path is None:
             QMessageBox.warning(self, "No File", "Please select an audio file first.")
             return
         
@@ -766,15 +1099,36 @@ class MainWindow(QMainWindow):
             'melody_method': self.melody_method_combo.currentText(),
             'use_demucs': self.use_demucs_check.isChecked(),
             'save_intermediate': self.save_intermediate_check.isChecked(),
+            'parallel_analysis': self.parallel_analysis_check.isChecked(),
+            'compute_type': self.compute_type_combo.currentText(),
+            'batch_size': self.batch_size_spin.value() if BATCHED_WHISPER_AVAILABLE else 1,
             'language': None  # None for auto-detection
         }
         
-        # Start processing thread
-        self.processing_thread = ProcessingThread(self.audio_file_path, config)
-        self.processing_thread.progress_updated.connect(self.update_progress)
-        self.processing_thread.stage_completed.connect(self.stage_completed)
-        self.processing_thread.processing_finished.connect(self.processing_finished)
-        self.processing_thread.error_occurred.connect(self.processing_error)
+        # Transcription dominates processing time; offer to keep the words we
+        # already have for this file and only redo chords and melody
+        if (self._song_data_audio_path == self.audio_file_path
+                and self.song_data is not None and self.song_data.words):
+            reply = QMessageBox.question(
+                self,
+                "Existing Transcription",
+                "This file has already been transcribed. Reuse the existing lyrics "
+                "and only re-detect chords and melody?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            if reply == QMessageBox.Yes:
+                # Chords are re-detected, so drop the old per-word assignments
+                config['cached_words'] = [dict(word.to_dict(), chord=None) for word in self.song_data.words]
+                config['cached_transcription'] = self.song_data.metadata.get('transcription', {})
+        
+        # Set up the processing job
+        self.processing_runnable = ProcessingRunnable(self.audio_file_path, config)
+        signals = self.processing_runnable.signals
+        signals.progress_updated.connect(self.update_progress)
+        signals.stage_completed.connect(self.stage_completed)
+        signals.processing_finished.connect(self.processing_finished)
+        signals.error_occurred.connect(self.processing_error)
         
         # Update UI
         self.process_btn.setEnabled(False)
@@ -783,12 +1137,32 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Processing audio...")
         
         # Start processing
-        self.processing_thread.start()
+        QThreadPool.globalInstance().start(self.processing_runnable)
     
     def update_progress(self, message: str, value: int):
-        """Update the progress bar."""
-        self.progress_bar.setValue(value)
-        self.status_bar.showMessage(message)
+        """Update the progress bar, applying at most one update per PROGRESS_INTERVAL_MS."""
+        self._pending_progress = (message, value)
+        if value >= 100 or self._progress_clock.elapsed() >= self.PROGRESS_INTERVAL_MS:
+            self._progress_timer.stop()
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            # Show the latest update once the interval is up
+            self._progress_timer.start(self.PROGRESS_INTERVAL_MS - self._progress_clock.elapsed())
+    
+    def _flush_progress(self):
+        """Apply the most recent progress update to the widgets."""
+        if self._pending_progress is None:
+            return
+        message, value = self._pending_progress
+        self._pending_progress = None
+        self._progress_clock.restart()
+        
+        # Repeated updates are common while a stage runs; skip the repaint.
+        # Compare with what's shown, since other code also writes the status bar
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
+        if message != self.status_bar.currentMessage():
+            self.status_bar.showMessage(message)
     
     def stage_completed(self, stage: str, data: Dict[str, Any]):
         """Handle stage completion."""
@@ -797,46 +1171,43 @@ class MainWindow(QMainWindow):
     def processing_finished(self, song_data: Dict[str, Any]):
         """Handle processing completion."""
         self.song_data = SongData.from_dict(song_data)
+        if self.processing_runnable is not None:
+            self._song_data_audio_path = self.processing_runnable.audio_file
         
         # Update song information
-        if self.song_data.metadata.get('title'):
-            self.title_edit.setText(self.song_data.metadata['title'])
-        if self.song_data.metadata.get('artist'):
-            self.artist_edit.setText(self.song_data.metadata['artist'])
-        if self.song_data.metadata.get('album'):
-            self.album_edit.setText(self.song_data.metadata['album'])
-        if self.song_data.metadata.get('genre'):
-            self.genre_edit.setText(self.song_data.metadata['genre'])
+        metadata = self.song_data.metadata
+        for key, widget in (('title', self.title_edit), ('artist', self.artist_edit),
+                            ('album', self.album_edit), ('genre', self.genre_edit)):
+            value = metadata.get(key)
+            if value:
+                widget.setText(value)
         
         # Update statistics
-        self.word_count_label.setText(str(self.song_data.get_word_count()))
-        self.chord_count_label.setText(str(self.song_data.get_chord_count()))
-        self.note_count_label.setText(str(self.song_data.get_note_count()))
+        word_count = self.song_data.get_word_count()
+        chord_count = self.song_data.get_chord_count()
+        note_count = self.song_data.get_note_count()
+        self.word_count_label.setText(str(word_count))
+        self.chord_count_label.setText(str(chord_count))
+        self.note_count_label.setText(str(note_count))
         
         # Update duration
         duration = self.song_data.get_duration()
         if duration > 0:
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
+            minutes, seconds = divmod(int(duration), 60)
             self.duration_label.setText(f"{minutes}:{seconds:02d}")
         
-        # Update editors
-        self.basic_lyrics_editor.set_song_data(self.song_data)
-        self.enhanced_lyrics_editor.set_song_data(self.song_data)
-        if hasattr(self, 'audio_file_path') and self.audio_file_path:
-            self.enhanced_lyrics_editor.set_audio_path(self.audio_file_path)
-        self.chord_editor.set_song_data(self.song_data)
-        self.melody_editor.set_song_data(self.song_data)
+        # Update editors; ones not built yet pick up self.song_data when created
+        self._broadcast_song_data()
         
         # Update UI
+        summary = f"Words: {word_count}, Chords: {chord_count}, Notes: {note_count}"
         self.process_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("Processing complete!")
+        self.status_bar.showMessage(f"Processing complete! {summary}")
         
-        # Auto-save the song data
-        if self.save_song_data_auto():
-            self.status_bar.showMessage("Processing complete! Song data auto-saved.")
-        else:
+        # Auto-save the song data; failures are reported when the write finishes
+        self._dirty = True
+        if not self.save_song_data_auto():
             self.status_bar.showMessage("Processing complete! Failed to auto-save song data.")
         
         # Show completion message
@@ -844,14 +1215,15 @@ class MainWindow(QMainWindow):
             self,
             "Processing Complete",
             f"Successfully processed audio file.\n"
-            f"Words: {self.song_data.get_word_count()}\n"
-            f"Chords: {self.song_data.get_chord_count()}\n"
-            f"Notes: {self.song_data.get_note_count()}\n\n"
-            f"Song data has been auto-saved."
+            f"{summary}\n\n"
+            f"Song data is being auto-saved."
         )
     
     def processing_error(self, error_message: str):
         """Handle processing error."""
+        # A held-back progress message must not replace the error status
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.process_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Processing failed!")
@@ -868,40 +1240,63 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Data", "No song data to save.")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Song Data",
-            "",
-            "JSON Files (*.json);;All Files (*)"
-        )
+        file_path = self._ask_save_path("Save Song Data", "JSON Files (*.json);;All Files (*)")
         
         if file_path:
-            exporter = JSONExporter()
-            if exporter.export(self.song_data.to_dict(), file_path):
-                self.status_bar.showMessage(f"Saved: {Path(file_path).name}")
-            else:
-                QMessageBox.critical(self, "Save Error", "Failed to save song data.")
+            self._start_export(self._json_exporter, file_path, 'save')
     
     def save_song_data_auto(self):
-        """Auto-save song data with the same name as the audio file."""
-        if not self.song_data or not hasattr(self, 'audio_file_path'):
-            return False
+        """Auto-save song data with the same name as the audio file.
         
-        try:
-            from pathlib import Path
-            audio_path = Path(self.audio_file_path)
-            song_data_path = audio_path.with_suffix('.song_data')
-            
-            exporter = JSONExporter()
-            if exporter.export(self.song_data.to_dict(), str(song_data_path)):
-                logging.info(f"Auto-saved song data to {song_data_path}")
-                return True
-            else:
-                logging.error(f"Failed to auto-save song data to {song_data_path}")
-                return False
-        except Exception as e:
-            logging.error(f"Error auto-saving song data: {e}")
+        Requests within AUTOSAVE_DELAY_MS of each other are coalesced into one
+        write on the thread pool; returns whether there was anything to save.
+        """
+        if not self.song_data or self.audio_file_path is None:
             return False
+        if not self._dirty:
+            # Nothing changed since the file was loaded or last saved
+            return True
+        
+        # Pin the data to its file now, in case another file is opened before the timer fires
+        self._autosave_target = (self.song_data, self._song_data_path)
+        self._autosave_timer.start(self.AUTOSAVE_DELAY_MS)
+        return True
+    
+    def _do_autosave(self):
+        """Write the most recently requested auto-save."""
+        if self._autosave_target is None or not self._dirty:
+            return
+        song_data, song_data_path = self._autosave_target
+        self._autosave_target = None
+        # Cleared now so edits made while the write runs schedule another one
+        self._dirty = False
+        self._start_export(self._json_exporter, song_data_path, 'autosave', song_data)
+    
+    def _start_export(self, exporter, file_path: str, kind: str, song_data: Optional[SongData] = None):
+        """Run exporter on song_data (default: the current song) on the global thread pool."""
+        if song_data is None:
+            song_data = self.song_data
+        QThreadPool.globalInstance().start(
+            _ExportRunnable(exporter, song_data.to_dict_cached(), file_path, kind,
+                            self._export_signals)
+        )
+    
+    def _on_export_finished(self, kind: str, file_path: str, success: bool):
+        """Report the result of an export started by _start_export."""
+        if kind == 'autosave':
+            if success:
+                logging.info("Auto-saved song data to %s", file_path)
+            else:
+                logging.error("Failed to auto-save song data to %s", file_path)
+                self.status_bar.showMessage("Failed to auto-save song data.")
+                self._dirty = True
+            return
+        
+        status, error_title, error_text = self._EXPORT_MESSAGES[kind]
+        if success:
+            self.status_bar.showMessage(status.format(Path(file_path).name))
+        else:
+            QMessageBox.critical(self, error_title, error_text)
     
     def export_midi(self):
         """Export song data to MIDI format."""
@@ -909,19 +1304,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Data", "No song data to export.")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export MIDI",
-            "",
-            "MIDI Files (*.mid);;All Files (*)"
-        )
+        file_path = self._ask_save_path("Export MIDI", "MIDI Files (*.mid);;All Files (*)")
         
         if file_path:
-            exporter = MidiExporter()
-            if exporter.export(self.song_data.to_dict(), file_path):
-                self.status_bar.showMessage(f"Exported MIDI: {Path(file_path).name}")
-            else:
-                QMessageBox.critical(self, "Export Error", "Failed to export MIDI.")
+            self._start_export(self._midi_exporter, file_path, 'midi')
     
     def export_ccli(self):
         """Export song data to CCLI format."""
@@ -929,19 +1315,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Data", "No song data to export.")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export CCLI",
-            "",
-            "Text Files (*.txt);;All Files (*)"
-        )
+        file_path = self._ask_save_path("Export CCLI", "Text Files (*.txt);;All Files (*)")
         
         if file_path:
-            exporter = CCLIExporter()
-            if exporter.export(self.song_data.to_dict(), file_path):
-                self.status_bar.showMessage(f"Exported CCLI: {Path(file_path).name}")
-            else:
-                QMessageBox.critical(self, "Export Error", "Failed to export CCLI.")
+            self._start_export(self._ccli_exporter, file_path, 'ccli')
     
     def export_json(self):
         """Export song data to JSON format."""
@@ -949,35 +1326,38 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Data", "No song data to export.")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export JSON",
-            "",
-            "JSON Files (*.json);;All Files (*)"
-        )
+        file_path = self._ask_save_path("Export JSON", "JSON Files (*.json);;All Files (*)")
         
         if file_path:
-            exporter = JSONExporter()
-            if exporter.export(self.song_data.to_dict(), file_path):
-                self.status_bar.showMessage(f"Exported JSON: {Path(file_path).name}")
-            else:
-                QMessageBox.critical(self, "Export Error", "Failed to export JSON.")
+            self._start_export(self._json_exporter, file_path, 'json')
+    
+    def _ask_save_path(self, title: str, name_filter: str) -> str:
+        """Ask for an output file, reusing one save dialog; returns "" if cancelled."""
+        if self._save_dialog is None:
+            self._save_dialog = QFileDialog(self)
+            self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+            self._save_dialog.setFileMode(QFileDialog.AnyFile)
+            self._save_dialog.setOptions(self._file_dialog_options)
+        self._save_dialog.setWindowTitle(title)
+        self._save_dialog.setNameFilters(name_filter.split(';;'))
+        self._save_dialog.selectFile("")
+        if self._save_dialog.exec():
+            return self._save_dialog.selectedFiles()[0]
+        return ""
     
     def show_about(self):
         """Show the about dialog."""
-        QMessageBox.about(
-            self,
-            "About Song Editor 3",
-            "Song Editor 3\n\n"
-            "A comprehensive audio processing and song analysis tool.\n\n"
-            "Features:\n"
-            "• Audio transcription with multiple Whisper models\n"
-            "• Chord detection with Chordino\n"
-            "• Melody extraction with Basic Pitch/CREPE\n"
-            "• Source separation with Demucs\n"
-            "• Export to MIDI, CCLI, and JSON formats\n\n"
-            "Version 3.0.0"
-        )
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About Song Editor 3")
+            self._about_box.setIconPixmap(self.windowIcon().pixmap(64, 64))
+            self._about_box.setText(self._ABOUT_TEXT)
+        self._about_box.exec()
+    
+    @staticmethod
+    def _combo_index(combo: QComboBox) -> Dict[str, int]:
+        """Map each item text of a fixed combo box to its index."""
+        return {combo.itemText(i): i for i in range(combo.count())}
     
     def load_settings(self):
         """Load application settings."""
@@ -987,23 +1367,38 @@ class MainWindow(QMainWindow):
             self.restoreGeometry(geometry)
         
         # Load processing options
-        whisper_model = self.settings.value('whisper_model', 'openai-whisper')
-        index = self.whisper_model_combo.findText(whisper_model)
-        if index >= 0:
-            self.whisper_model_combo.setCurrentIndex(index)
-        
-        chord_method = self.settings.value('chord_method', 'chordino')
-        index = self.chord_method_combo.findText(chord_method)
-        if index >= 0:
-            self.chord_method_combo.setCurrentIndex(index)
-        
-        melody_method = self.settings.value('melody_method', 'basic-pitch')
-        index = self.melody_method_combo.findText(melody_method)
-        if index >= 0:
-            self.melody_method_combo.setCurrentIndex(index)
+        self._migrate_processing_settings()
+        self.settings.beginGroup('processing')
+        for key, default, combo, indexes in (
+            ('whisper_model', 'openai-whisper', self.whisper_model_combo, self._whisper_model_index),
+            ('chord_method', 'chordino', self.chord_method_combo, self._chord_method_index),
+            ('melody_method', 'basic-pitch', self.melody_method_combo, self._melody_method_index),
+            ('compute_type', 'float32', self.compute_type_combo, self._compute_type_index),
+        ):
+            index = indexes.get(self.settings.value(key, default), -1)
+            if index >= 0:
+                combo.setCurrentIndex(index)
         
         self.use_demucs_check.setChecked(self.settings.value('use_demucs', True, type=bool))
         self.save_intermediate_check.setChecked(self.settings.value('save_intermediate', True, type=bool))
+        self.parallel_analysis_check.setChecked(self.settings.value('parallel_analysis', True, type=bool))
+        self.batch_size_spin.setValue(self.settings.value('batch_size', 1, type=int))
+        self.settings.endGroup()
+    
+    # Processing options that used to be stored at the top level
+    _LEGACY_PROCESSING_KEYS = (
+        'whisper_model', 'chord_method', 'melody_method', 'use_demucs',
+        'save_intermediate', 'parallel_analysis', 'compute_type', 'batch_size'
+    )
+    
+    def _migrate_processing_settings(self):
+        """Move processing options saved by older versions into the 'processing' group."""
+        if 'processing' in self.settings.childGroups():
+            return
+        for key in self._LEGACY_PROCESSING_KEYS:
+            if self.settings.contains(key):
+                self.settings.setValue(f'processing/{key}', self.settings.value(key))
+                self.settings.remove(key)
     
     def save_settings(self):
         """Save application settings."""
@@ -1011,15 +1406,37 @@ class MainWindow(QMainWindow):
         self.settings.setValue('geometry', self.saveGeometry())
         
         # Save processing options
+        self.settings.beginGroup('processing')
         self.settings.setValue('whisper_model', self.whisper_model_combo.currentText())
         self.settings.setValue('chord_method', self.chord_method_combo.currentText())
         self.settings.setValue('melody_method', self.melody_method_combo.currentText())
         self.settings.setValue('use_demucs', self.use_demucs_check.isChecked())
         self.settings.setValue('save_intermediate', self.save_intermediate_check.isChecked())
+        self.settings.setValue('parallel_analysis', self.parallel_analysis_check.isChecked())
+        self.settings.setValue('compute_type', self.compute_type_combo.currentText())
+        self.settings.setValue('batch_size', self.batch_size_spin.value())
+        self.settings.endGroup()
+        
+        # Flush everything to disk in one go
+        self.settings.sync()
     
     def closeEvent(self, event):
         """Handle window close event."""
         self.save_settings()
+        
+        # The editor is a child widget, so it gets no close event of its own
+        if self.enhanced_lyrics_editor is not None:
+            self.enhanced_lyrics_editor.shutdown_audio()
+        
+        # Don't lose a pending auto-save; write it here rather than on the pool,
+        # which may not get to it before the application exits
+        if self._autosave_timer.isActive():
+            self._autosave_timer.stop()
+            song_data, song_data_path = self._autosave_target
+            self._autosave_target = None
+            if not self._json_exporter.export(song_data.to_dict_cached(), song_data_path):
+                logging.error("Failed to auto-save song data to %s", song_data_path)
+        
         event.accept()
 
 
@@ -6,29 +6,242 @@ Melody editing interface for Song Editor 3.
 """
 
 import logging
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
+
+import numpy as np
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QSpinBox, QDoubleSpinBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QTableView,
+    QAbstractItemView, QPushButton, QLabel, QSpinBox, QDoubleSpinBox,
     QGroupBox, QGridLayout, QHeaderView, QMessageBox, QComboBox,
-    QCheckBox, QLineEdit, QSplitter, QListWidget, QListWidgetItem,
+    QCheckBox, QLineEdit, QSplitter, QListView,
     QSlider
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QColor, QPainter, QPen, QBrush
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QRect, QSize, QAbstractTableModel, QIdentityProxyModel,
+    QModelIndex
+)
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QBrush, QPixmap
 
 from ..models.song_data import SongData, Note
+from ..core.note_merge import merge_runs
+
+
+_NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+
+# Names for every MIDI pitch, built once instead of formatted per lookup
+_MIDI_NAMES = tuple(f"{_NOTE_NAMES[m % 12]}{(m // 12) - 1}" for m in range(128))
+_MIDI_NAME_ARRAY = np.array(_MIDI_NAMES)
+
+
+def _midi_to_note_name(midi_pitch: int) -> str:
+    """Convert MIDI pitch to note name."""
+    return _MIDI_NAMES[min(127, max(0, midi_pitch))]
+
+
+def _midi_to_note_names(pitches: np.ndarray) -> List[str]:
+    """Convert an array of MIDI pitches to note names in one pass."""
+    return _MIDI_NAME_ARRAY[np.clip(pitches, 0, 127)].tolist()
+
+
+class NoteTableModel(QAbstractTableModel):
+    """Table model over the editor's note list.
+    
+    The view only asks for the rows it shows, so refreshing the table no longer
+    allocates an item per cell and cells are formatted as they are painted.
+    Pitch and timing are also kept as parallel NumPy columns for the editor's
+    bulk passes; the ``Note`` objects stay authoritative and edits write
+    through to both.
+    """
+    
+    HEADERS = ["Pitch", "Note Name", "Start Time", "End Time", "Duration", "Velocity", "Confidence", "Method"]
+    
+    # Name and duration are derived from the other columns
+    EDITABLE_COLUMNS = (0, 2, 3, 5, 6, 7)
+    
+    # One-line description of a note's row, shown by the note list
+    SUMMARY_ROLE = Qt.UserRole + 1
+    
+    note_edited = Signal(int, int)
+    edit_rejected = Signal(int, int)
+    
+    def __init__(self, notes: List[Note], parent=None):
+        super().__init__(parent)
+        self.notes = notes
+        self._rebuild_columns()
+    
+    def _rebuild_columns(self):
+        """Snapshot the numeric note fields into the NumPy columns."""
+        n = len(self.notes)
+        self.pitches = np.fromiter((note.pitch_midi for note in self.notes), dtype=np.int16, count=n)
+        self.starts = np.fromiter((note.start for note in self.notes), dtype=np.float64, count=n)
+        self.ends = np.fromiter((note.end for note in self.notes), dtype=np.float64, count=n)
+    
+    def set_notes(self, notes: List[Note]):
+        """Point the model at a (possibly new) note list."""
+        self.beginResetModel()
+        self.notes = notes
+        self._rebuild_columns()
+        self.endResetModel()
+    
+    def insert_notes(self, row: int, notes: List[Note]):
+        """Insert notes before ``row``."""
+        if not notes:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(notes) - 1)
+        self.notes[row:row] = notes
+        self.pitches = np.insert(self.pitches, row, [n.pitch_midi for n in notes])
+        self.starts = np.insert(self.starts, row, [n.start for n in notes])
+        self.ends = np.insert(self.ends, row, [n.end for n in notes])
+        self.endInsertRows()
+    
+    def remove_notes(self, first: int, last: int):
+        """Remove the notes in rows ``[first, last)``."""
+        if first >= last:
+            return
+        self.beginRemoveRows(QModelIndex(), first, last - 1)
+        del self.notes[first:last]
+        self.pitches = np.delete(self.pitches, np.s_[first:last])
+        self.starts = np.delete(self.starts, np.s_[first:last])
+        self.ends = np.delete(self.ends, np.s_[first:last])
+        self.endRemoveRows()
+    
+    def swap_notes(self, row: int):
+        """Swap the note at ``row`` with the one after it."""
+        # Destination is the row after the one we swap with
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row + 2)
+        self.notes[row], self.notes[row + 1] = self.notes[row + 1], self.notes[row]
+        for column in (self.pitches, self.starts, self.ends):
+            column[[row, row + 1]] = column[[row + 1, row]]
+        self.endMoveRows()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.notes)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        note = self.notes[index.row()]
+        col = index.column()
+        
+        if role == self.SUMMARY_ROLE:
+            return f"{_midi_to_note_name(note.pitch_midi)} ({note.pitch_midi}) - {note.end - note.start:.2f}s"
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        
+        if col == 0:
+            return str(note.pitch_midi)
+        elif col == 1:
+            return _midi_to_note_name(note.pitch_midi)
+        elif col == 2:
+            return f"{note.start:.3f}"
+        elif col == 3:
+            return f"{note.end:.3f}"
+        elif col == 4:
+            return f"{note.end - note.start:.3f}"
+        elif col == 5:
+            return str(note.velocity or 80)
+        elif col == 6:
+            return f"{note.confidence or 0.5:.3f}"
+        elif col == 7:
+            return note.detection_method or ""
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in self.EDITABLE_COLUMNS:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        
+        row = index.row()
+        col = index.column()
+        note = self.notes[row]
+        
+        try:
+            # Columns first, so a value they can't hold leaves the note untouched
+            if col == 0:  # MIDI pitch
+                pitch = int(value)
+                if not 0 <= pitch <= 127:
+                    raise ValueError(f"MIDI pitch out of range: {pitch}")
+                self.pitches[row] = pitch
+                note.pitch_midi = pitch
+                note.pitch_name = _midi_to_note_name(pitch)
+            elif col == 2:  # Start time
+                start = float(value)
+                self.starts[row] = start
+                note.start = start
+            elif col == 3:  # End time
+                end = float(value)
+                self.ends[row] = end
+                note.end = end
+            elif col == 5:  # Velocity
+                note.velocity = int(value)
+            elif col == 6:  # Confidence
+                note.confidence = float(value)
+            elif col == 7:  # Detection method
+                note.detection_method = value
+            else:
+                return False
+        except ValueError:
+            # The view keeps showing the old value
+            self.edit_rejected.emit(row, col)
+            return False
+        
+        # Name and duration follow pitch and timing, so refresh the whole row
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        self.note_edited.emit(row, col)
+        return True
+
+
+class NoteListModel(QIdentityProxyModel):
+    """Shows each row of a NoteTableModel as its one-line summary."""
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            role = NoteTableModel.SUMMARY_ROLE
+        return super().data(index, role)
+    
+    def flags(self, index):
+        return super().flags(index) & ~Qt.ItemIsEditable
 
 
 class MelodyEditor(QWidget):
     """Melody editing interface."""
     
-    melody_changed = Signal(list)
+    melody_changed = Signal()  # receivers pull the notes via get_notes()
     
     def __init__(self):
         super().__init__()
         self.song_data = None
         self.notes = []
+        # self.notes may be the caller's list until the first edit that
+        # changes the list itself; see _own_notes()
+        self._owns_notes = True
+        # Edits in quick succession share one refresh of the other views and
+        # one melody_changed emit
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_deferred_refresh)
+        self._geometry_edited = False
+        self._melody_pending = False
+        # The note table and the note list are two views of one model
+        self.note_model = NoteTableModel(self.notes, self)
         self.init_ui()
     
     def init_ui(self):
@@ -66,8 +279,12 @@ class MelodyEditor(QWidget):
         
         # Note list
         layout.addWidget(QLabel("Notes:"))
-        self.note_list = QListWidget()
-        self.note_list.itemClicked.connect(self.on_note_item_clicked)
+        self.note_list_model = NoteListModel(self)
+        self.note_list_model.setSourceModel(self.note_model)
+        self.note_list = QListView()
+        self.note_list.setModel(self.note_list_model)
+        self.note_list.setUniformItemSizes(True)
+        self.note_list.clicked.connect(self.on_note_item_clicked)
         layout.addWidget(self.note_list)
         
         # Melody statistics
@@ -97,25 +314,25 @@ class MelodyEditor(QWidget):
         
         # Table
         layout.addWidget(QLabel("Note Details:"))
-        self.note_table = QTableWidget()
-        self.note_table.setColumnCount(8)
-        self.note_table.setHorizontalHeaderLabels([
-            "Pitch", "Note Name", "Start Time", "End Time", "Duration", "Velocity", "Confidence", "Method"
-        ])
+        self.note_table = QTableView()
+        self.note_table.setModel(self.note_model)
+        self.note_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         
-        # Set table properties
+        # Set table properties. Fixed default widths and uniform row heights
+        # keep Qt from measuring every row whenever the notes change
         header = self.note_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
+        for col, width in enumerate((50, 75, 80, 80, 70, 65, 80)):
+            header.setSectionResizeMode(col, QHeaderView.Interactive)
+            header.resizeSection(col, width)
         header.setSectionResizeMode(7, QHeaderView.Stretch)
-        
-        self.note_table.itemChanged.connect(self.on_table_item_changed)
-        self.note_table.itemSelectionChanged.connect(self.on_table_selection_changed)
+        self.note_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Rows follow the note order, and wrapped cells would need measuring
+        self.note_table.setSortingEnabled(False)
+        self.note_table.setWordWrap(False)
+        
+        self.note_model.note_edited.connect(self.on_table_item_changed)
+        self.note_model.edit_rejected.connect(self.on_table_edit_rejected)
+        self.note_table.selectionModel().selectionChanged.connect(self.on_table_selection_changed)
         layout.addWidget(self.note_table)
         
         return panel
@@ -137,7 +354,7 @@ class MelodyEditor(QWidget):
         note_layout.addWidget(self.pitch_spin, 0, 1)
         
         # Note name display
-        self.note_name_label = QLabel("C")
+        self.note_name_label = QLabel(_midi_to_note_name(self.pitch_spin.value()))
         note_layout.addWidget(QLabel("Note Name:"), 0, 2)
         note_layout.addWidget(self.note_name_label, 0, 3)
         
@@ -148,7 +365,8 @@ class MelodyEditor(QWidget):
         note_layout.addWidget(QLabel("Velocity:"), 1, 0)
         note_layout.addWidget(self.velocity_spin, 1, 1)
         
-        # Connect signals for note name update
+        # Connect signals for note name update. The name is a table lookup,
+        # so it can follow every step of the spin box
         self.pitch_spin.valueChanged.connect(self.update_note_name)
         
         layout.addWidget(note_group)
@@ -216,80 +434,52 @@ class MelodyEditor(QWidget):
     def set_song_data(self, song_data: SongData):
         """Set the song data to edit."""
         self.song_data = song_data
-        self.notes = song_data.notes.copy()
+        self.notes = song_data.notes
+        self._owns_notes = False
         self.update_display()
     
+    def _own_notes(self):
+        """Copy the note list before the first in-place change to it."""
+        if not self._owns_notes:
+            self.notes = list(self.notes)
+            # Same rows, so the model needs no reset
+            self.note_model.notes = self.notes
+            self._owns_notes = True
+    
     def update_display(self):
         """Update the display with current note data."""
-        self.update_note_list()
+        # The table model also feeds the note list, and its columns the statistics
         self.update_table()
         self.update_statistics()
         self.melody_widget.set_notes(self.notes)
     
-    def update_note_list(self):
-        """Update the note list."""
-        self.note_list.clear()
-        
-        for note in self.notes:
-            note_name = self.midi_to_note_name(note.pitch_midi)
-            duration = note.end - note.start
-            item_text = f"{note_name} ({note.pitch_midi}) - {duration:.2f}s"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, note)
-            self.note_list.addItem(item)
+    @contextmanager
+    def _views_updates_paused(self):
+        """Suspend repaints and sorting of the note views while the model is reset."""
+        was_sorting = self.note_table.isSortingEnabled()
+        self.note_table.setSortingEnabled(False)
+        self.note_table.setUpdatesEnabled(False)
+        self.note_list.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.note_list.setUpdatesEnabled(True)
+            self.note_table.setUpdatesEnabled(True)
+            self.note_table.setSortingEnabled(was_sorting)
     
     def update_table(self):
-        """Update the note table."""
-        self.note_table.blockSignals(True)
-        self.note_table.setRowCount(len(self.notes))
-        
-        for row, note in enumerate(self.notes):
-            # MIDI pitch
-            pitch_item = QTableWidgetItem(str(note.pitch_midi))
-            self.note_table.setItem(row, 0, pitch_item)
-            
-            # Note name
-            note_name = self.midi_to_note_name(note.pitch_midi)
-            name_item = QTableWidgetItem(note_name)
-            self.note_table.setItem(row, 1, name_item)
-            
-            # Start time
-            start_item = QTableWidgetItem(f"{note.start:.3f}")
-            self.note_table.setItem(row, 2, start_item)
-            
-            # End time
-            end_item = QTableWidgetItem(f"{note.end:.3f}")
-            self.note_table.setItem(row, 3, end_item)
-            
-            # Duration
-            duration = note.end - note.start
-            duration_item = QTableWidgetItem(f"{duration:.3f}")
-            self.note_table.setItem(row, 4, duration_item)
-            
-            # Velocity
-            velocity = note.velocity or 80
-            velocity_item = QTableWidgetItem(str(velocity))
-            self.note_table.setItem(row, 5, velocity_item)
-            
-            # Confidence
-            confidence = note.confidence or 0.5
-            conf_item = QTableWidgetItem(f"{confidence:.3f}")
-            self.note_table.setItem(row, 6, conf_item)
-            
-            # Detection method
-            method_item = QTableWidgetItem(note.detection_method or "")
-            self.note_table.setItem(row, 7, method_item)
-        
-        self.note_table.blockSignals(False)
+        """Update the note table; the view re-reads only the rows it shows."""
+        with self._views_updates_paused():
+            self.note_model.set_notes(self.notes)
     
     def update_statistics(self):
         """Update the statistics display."""
         total_notes = len(self.notes)
         
         if total_notes > 0:
-            pitches = [note.pitch_midi for note in self.notes]
-            pitch_range = max(pitches) - min(pitches)
-            avg_duration = sum(note.end - note.start for note in self.notes) / total_notes
+            model = self.note_model
+            pitch_range = int(np.ptp(model.pitches))
+            avg_duration = float((model.ends - model.starts).mean())
         else:
             pitch_range = 0
             avg_duration = 0.0
@@ -298,78 +488,52 @@ class MelodyEditor(QWidget):
         self.range_label.setText(str(pitch_range))
         self.avg_duration_label.setText(f"{avg_duration:.2f}s")
     
-    def update_note_name(self):
+    def update_note_name(self, pitch: int):
         """Update the note name display."""
-        pitch = self.pitch_spin.value()
-        note_name = self.midi_to_note_name(pitch)
-        self.note_name_label.setText(note_name)
+        self.note_name_label.setText(_MIDI_NAMES[pitch])
     
     def midi_to_note_name(self, midi_pitch: int) -> str:
         """Convert MIDI pitch to note name."""
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (midi_pitch // 12) - 1
-        note_name = note_names[midi_pitch % 12]
-        return f"{note_name}{octave}"
+        return _midi_to_note_name(midi_pitch)
     
-    def on_note_item_clicked(self, item):
+    def on_note_item_clicked(self, index):
         """Handle note list item click."""
-        note = item.data(Qt.UserRole)
-        if note:
-            # Find the note in the table and select it
-            for row in range(self.note_table.rowCount()):
-                if self.notes[row] == note:
-                    self.note_table.selectRow(row)
-                    self.note_table.scrollToItem(self.note_table.item(row, 0))
-                    break
-    
-    def on_table_item_changed(self, item):
-        """Handle table item changes."""
-        row = item.row()
-        col = item.column()
-        
-        if row >= len(self.notes):
-            return
-        
-        note = self.notes[row]
-        
-        try:
-            if col == 0:  # MIDI pitch
-                note.pitch_midi = int(item.text())
-                note.pitch_name = self.midi_to_note_name(note.pitch_midi)
-            elif col == 2:  # Start time
-                note.start = float(item.text())
-            elif col == 3:  # End time
-                note.end = float(item.text())
-            elif col == 5:  # Velocity
-                note.velocity = int(item.text())
-            elif col == 6:  # Confidence
-                note.confidence = float(item.text())
-            elif col == 7:  # Detection method
-                note.detection_method = item.text()
-            
-            # Update duration column
-            duration = note.end - note.start
-            duration_item = QTableWidgetItem(f"{duration:.3f}")
-            self.note_table.setItem(row, 4, duration_item)
-            
-            # Update note name column
-            note_name = self.midi_to_note_name(note.pitch_midi)
-            name_item = QTableWidgetItem(note_name)
-            self.note_table.setItem(row, 1, name_item)
-            
-            self.update_note_list()
+        # List rows are the table's rows
+        row = index.row()
+        if 0 <= row < self.note_model.rowCount():
+            self.note_table.selectRow(row)
+            self.note_table.scrollTo(self.note_model.index(row, 0))
+    
+    def on_table_item_changed(self, row: int, col: int):
+        """Handle an edit committed through the note table."""
+        # The edited row is already updated in the table and the list
+        if col in (0, 2, 3):
+            self._geometry_edited = True
+        self._notify_melody_changed()
+    
+    def _notify_melody_changed(self):
+        """Emit melody_changed once the current burst of changes settles."""
+        self._melody_pending = True
+        self._refresh_timer.start()
+    
+    def _do_deferred_refresh(self):
+        """Bring the statistics and piano roll up to date after table edits."""
+        # Only pitch and timing feed the statistics and the piano roll
+        if self._geometry_edited:
+            self._geometry_edited = False
             self.update_statistics()
             self.melody_widget.set_notes(self.notes)
-            self.melody_changed.emit(self.notes)
-            
-        except ValueError:
-            # Revert invalid input
-            self.update_table()
-            QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
+        if self._melody_pending:
+            self._melody_pending = False
+            self.melody_changed.emit()
+    
+    def on_table_edit_rejected(self, row: int, col: int):
+        """Warn about a table edit that didn't parse."""
+        QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
     
     def on_table_selection_changed(self):
         """Handle table selection changes."""
-        current_row = self.note_table.currentRow()
+        current_row = self.note_table.currentIndex().row()
         if current_row >= 0 and current_row < len(self.notes):
             note = self.notes[current_row]
             
@@ -383,17 +547,22 @@ class MelodyEditor(QWidget):
     
     def add_note(self):
         """Add a new note."""
-        # Get current selection
-        current_row = self.note_table.currentRow()
-        if current_row < 0:
-            current_row = len(self.notes)
-        
         # Get note details from controls
         pitch = self.pitch_spin.value()
         velocity = self.velocity_spin.value()
         start_time = self.start_time_spin.value()
         end_time = self.end_time_spin.value()
         
+        # Insert at the selection; with nothing selected, keep notes that are
+        # in time order that way by binary-searching the start column
+        current_row = self.note_table.currentIndex().row()
+        if current_row < 0:
+            starts = self.note_model.starts
+            if np.all(starts[1:] >= starts[:-1]):
+                current_row = int(np.searchsorted(starts, start_time, side='right'))
+            else:
+                current_row = len(self.notes)
+        
         # Create new note
         new_note = Note(
             pitch_midi=pitch,
@@ -406,42 +575,48 @@ class MelodyEditor(QWidget):
         )
         
         # Insert note
-        self.notes.insert(current_row, new_note)
-        self.update_display()
+        self._own_notes()
+        self.note_model.insert_notes(current_row, [new_note])
+        self.update_statistics()
+        self.melody_widget.set_notes(self.notes)
         
         # Select the new note
         self.note_table.selectRow(current_row)
         self.note_table.setFocus()
         
-        self.melody_changed.emit(self.notes)
+        self._notify_melody_changed()
     
     def delete_note(self):
         """Delete the selected note."""
-        current_row = self.note_table.currentRow()
+        current_row = self.note_table.currentIndex().row()
         if current_row >= 0 and current_row < len(self.notes):
-            del self.notes[current_row]
-            self.update_display()
-            self.melody_changed.emit(self.notes)
+            self._own_notes()
+            self.note_model.remove_notes(current_row, current_row + 1)
+            self.update_statistics()
+            self.melody_widget.set_notes(self.notes)
+            self._notify_melody_changed()
     
     def move_note_up(self):
         """Move the selected note up."""
-        current_row = self.note_table.currentRow()
+        current_row = self.note_table.currentIndex().row()
         if current_row > 0:
-            self.notes[current_row], self.notes[current_row - 1] = \
-                self.notes[current_row - 1], self.notes[current_row]
-            self.update_display()
+            self._swap_rows(current_row - 1)
             self.note_table.selectRow(current_row - 1)
-            self.melody_changed.emit(self.notes)
+            self._notify_melody_changed()
     
     def move_note_down(self):
         """Move the selected note down."""
-        current_row = self.note_table.currentRow()
-        if current_row < len(self.notes) - 1:
-            self.notes[current_row], self.notes[current_row + 1] = \
-                self.notes[current_row + 1], self.notes[current_row]
-            self.update_display()
+        current_row = self.note_table.currentIndex().row()
+        if 0 <= current_row < len(self.notes) - 1:
+            self._swap_rows(current_row)
             self.note_table.selectRow(current_row + 1)
-            self.melody_changed.emit(self.notes)
+            self._notify_melody_changed()
+    
+    def _swap_rows(self, row: int):
+        """Swap the note at ``row`` with the one after it."""
+        # Reordering changes neither the statistics nor the piano roll
+        self._own_notes()
+        self.note_model.swap_notes(row)
     
     def filter_short_notes(self):
         """Filter out very short notes."""
@@ -449,15 +624,15 @@ class MelodyEditor(QWidget):
             return
         
         min_duration = 0.1  # 100ms minimum
-        original_count = len(self.notes)
-        
-        self.notes = [note for note in self.notes if (note.end - note.start) >= min_duration]
-        
-        filtered_count = original_count - len(self.notes)
+        model = self.note_model
+        keep = (model.ends - model.starts) >= min_duration
+        filtered_count = len(keep) - int(keep.sum())
         
         if filtered_count > 0:
+            self.notes = [self.notes[i] for i in np.flatnonzero(keep).tolist()]
+            self._owns_notes = True
             self.update_display()
-            self.melody_changed.emit(self.notes)
+            self._notify_melody_changed()
             
             QMessageBox.information(
                 self,
@@ -476,26 +651,25 @@ class MelodyEditor(QWidget):
         if len(self.notes) < 2:
             return
         
-        merged_count = 0
-        i = 0
-        
-        while i < len(self.notes) - 1:
-            current_note = self.notes[i]
-            next_note = self.notes[i + 1]
-            
-            # Check if notes are consecutive and have same pitch
-            if (current_note.pitch_midi == next_note.pitch_midi and 
-                abs(current_note.end - next_note.start) < 0.1):  # 100ms gap tolerance
-                # Merge notes
-                current_note.end = next_note.end
-                del self.notes[i + 1]
-                merged_count += 1
-            else:
-                i += 1
+        # A note merges into the one before it when they share a pitch and
+        # the gap between them is under 100ms. Merging a run keeps its first
+        # note and extends it to the end of the last one
+        model = self.note_model
+        firsts, lasts = merge_runs(model.pitches, model.starts, model.ends, 0.1)
+        merged_count = len(self.notes) - len(firsts)
         
         if merged_count > 0:
+            merged = []
+            for first, last in zip(firsts.tolist(), lasts.tolist()):
+                note = self.notes[first]
+                if last != first:
+                    note.end = self.notes[last].end
+                merged.append(note)
+            self.notes = merged
+            self._owns_notes = True
+            
             self.update_display()
-            self.melody_changed.emit(self.notes)
+            self._notify_melody_changed()
             
             QMessageBox.information(
                 self,
@@ -510,12 +684,13 @@ class MelodyEditor(QWidget):
             )
     
     def get_notes(self) -> List[Note]:
-        """Get the current note list."""
+        """Get a copy of the current note list."""
         return self.notes.copy()
     
     def set_notes(self, notes: List[Note]):
         """Set the note list."""
-        self.notes = notes.copy()
+        self.notes = notes
+        self._owns_notes = False
         self.update_display()
     
     def export_melody_midi(self) -> List[int]:
@@ -526,6 +701,7 @@ class MelodyEditor(QWidget):
         """Import melody from list of MIDI pitches."""
         # Create note objects with default timing
         self.notes = []
+        self._owns_notes = True
         for i, pitch in enumerate(midi_pitches):
             start_time = i * 0.5  # Default 0.5s per note
             end_time = start_time + 0.5
@@ -542,7 +718,7 @@ class MelodyEditor(QWidget):
             self.notes.append(note)
         
         self.update_display()
-        self.melody_changed.emit(self.notes)
+        self._notify_melody_changed()
 
 
 class MelodyVisualizationWidget(QWidget):
@@ -551,22 +727,40 @@ class MelodyVisualizationWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.notes = []
+        self._pitches = np.empty(0, dtype=np.int16)
+        self._starts = np.empty(0, dtype=np.float64)
+        self._ends = np.empty(0, dtype=np.float64)
         self.setMinimumHeight(200)
         self.setMaximumHeight(300)
+        # The piano roll is rendered into a pixmap and only redrawn when the
+        # notes change or a resize settles; other repaints just blit it
+        self._cache_pixmap = None
+        self._cache_size = QSize()
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self.update)
     
     def set_notes(self, notes: List[Note]):
         """Set the notes to visualize."""
         self.notes = notes
+        n = len(notes)
+        self._pitches = np.fromiter((note.pitch_midi for note in notes), dtype=np.int16, count=n)
+        self._starts = np.fromiter((note.start for note in notes), dtype=np.float64, count=n)
+        self._ends = np.fromiter((note.end for note in notes), dtype=np.float64, count=n)
+        self._cache_pixmap = None
         self.update()
     
+    def resizeEvent(self, event):
+        """Re-render at the new size once resizing pauses."""
+        super().resizeEvent(event)
+        self._resize_timer.start()
+    
     def paintEvent(self, event):
         """Paint the melody visualization."""
         if not self.notes:
             return
         
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
         # Get dimensions
         width = self.width()
         height = self.height()
@@ -574,21 +768,29 @@ class MelodyVisualizationWidget(QWidget):
         if width <= 0 or height <= 0:
             return
         
-        # Find time range
-        if self.notes:
-            min_time = min(note.start for note in self.notes)
-            max_time = max(note.end for note in self.notes)
-            time_range = max_time - min_time
-        else:
-            time_range = 1.0
+        # While a resize is in progress the previous rendering is stretched
+        if self._cache_pixmap is None or (self._cache_size != self.size()
+                                          and not self._resize_timer.isActive()):
+            self._render_cache(width, height)
         
-        # Find pitch range
-        if self.notes:
-            min_pitch = min(note.pitch_midi for note in self.notes)
-            max_pitch = max(note.pitch_midi for note in self.notes)
-            pitch_range = max_pitch - min_pitch + 1
-        else:
-            pitch_range = 12
+        painter = QPainter(self)
+        painter.drawPixmap(self.rect(), self._cache_pixmap)
+    
+    def _render_cache(self, width: int, height: int):
+        """Render the piano roll into the cached pixmap."""
+        ratio = self.devicePixelRatioF()
+        self._cache_pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        self._cache_pixmap.setDevicePixelRatio(ratio)
+        self._cache_size = self.size()
+        
+        painter = QPainter(self._cache_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Find time and pitch range
+        min_time = float(self._starts.min())
+        time_range = float(self._ends.max()) - min_time
+        max_pitch = int(self._pitches.max())
+        pitch_range = max_pitch - int(self._pitches.min()) + 1
         
         # Draw background
         painter.fillRect(0, 0, width, height, QColor(240, 240, 240))
@@ -606,31 +808,35 @@ class MelodyVisualizationWidget(QWidget):
             y = (i * height) // 10
             painter.drawLine(0, y, width, y)
         
-        # Draw notes
-        for note in self.notes:
-            # Calculate position and size
-            x1 = ((note.start - min_time) / time_range) * width
-            x2 = ((note.end - min_time) / time_range) * width
-            y = ((max_pitch - note.pitch_midi) / pitch_range) * height
-            
-            note_width = x2 - x1
-            note_height = height / pitch_range
-            
-            # Draw note rectangle
-            painter.setPen(QPen(QColor(0, 0, 0), 1))
-            painter.setBrush(QBrush(QColor(100, 150, 255)))
-            painter.drawRect(int(x1), int(y), int(note_width), int(note_height))
-            
-            # Draw note name
-            if note_width > 20:  # Only draw text if note is wide enough
-                painter.setPen(QColor(255, 255, 255))
-                painter.setFont(QFont("Arial", 8))
-                note_name = self.midi_to_note_name(note.pitch_midi)
-                painter.drawText(int(x1 + 2), int(y + note_height - 2), note_name)
+        # Lay out all notes at once, then draw all bodies and all labels with
+        # one pen/brush change each
+        note_height = height / pitch_range
+        x1 = (self._starts - min_time) / time_range * width
+        x2 = (self._ends - min_time) / time_range * width
+        y = (max_pitch - self._pitches) / pitch_range * height
+        note_widths = x2 - x1
+        h = int(note_height)
+        rects = [QRect(xi, yi, wi, h) for xi, yi, wi in zip(
+            x1.astype(np.int32).tolist(), y.astype(np.int32).tolist(),
+            note_widths.astype(np.int32).tolist())]
+        # Only notes wide enough for their name get a label
+        labeled = np.flatnonzero(note_widths > 20)
+        
+        painter.setPen(QPen(QColor(0, 0, 0), 1))
+        painter.setBrush(QBrush(QColor(100, 150, 255)))
+        painter.drawRects(rects)
+        
+        if labeled.size:
+            painter.setPen(QColor(255, 255, 255))
+            painter.setFont(QFont("Arial", 8))
+            label_xs = (x1[labeled] + 2).astype(np.int32).tolist()
+            label_ys = (y[labeled] + note_height - 2).astype(np.int32).tolist()
+            names = _midi_to_note_names(self._pitches[labeled])
+            for label_x, label_y, name in zip(label_xs, label_ys, names):
+                painter.drawText(label_x, label_y, name)
+        
+        painter.end()
     
     def midi_to_note_name(self, midi_pitch: int) -> str:
         """Convert MIDI pitch to note name."""
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (midi_pitch // 12) - 1
-        note_name = note_names[midi_pitch % 12]
-        return f"{note_name}{octave}"
+        return _midi_to_note_name(midi_pitch)
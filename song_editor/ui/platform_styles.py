@@ -6,634 +6,257 @@ Provides platform-appropriate styling for macOS, iOS, Windows, and Android
 while maintaining all functionality across platforms.
 """
 
-from typing import Dict, Any
-from ..platform_utils import PlatformUtils
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Mapping, NamedTuple
+
+
+# Colors every platform uses alike
+_DISABLED_BG = sys.intern("#CCCCCC")
+_SECONDARY_TEXT = sys.intern("#666666")
+
+# Every platform shares one stylesheet layout, one rule per line; only the
+# values in its palette below differ
+_TEMPLATE = (
+    "QMainWindow{{background-color:{bg};color:#000000;font-family:\"{font}\";font-size:{font_size}px;}}"
+    "QMenuBar{{background-color:{bg};border-bottom:1px solid {border};padding:{menu_bar_padding};}}"
+    "QMenuBar::item{{background-color:transparent;padding:{menu_item_padding};border-radius:{menu_item_radius}px;{touch_font}}}"
+    "QMenuBar::item:selected{{background-color:{accent};color:white;}}"
+    "QPushButton{{background-color:{accent};color:white;border:none;border-radius:{button_radius}px;padding:{button_padding};font-weight:{button_weight};{touch_font}min-height:{button_min_height}px;}}"
+    "QPushButton:hover{{background-color:{accent_hover};}}"
+    "QPushButton:pressed{{background-color:{accent_pressed};}}"
+    "QPushButton:disabled{{background-color:{disabled_bg};color:{secondary_text};}}"
+    "QTabWidget::pane{{border:1px solid {border};border-radius:{radius}px;background-color:white;}}"
+    "QTabBar::tab{{background-color:{bg};color:{secondary_text};padding:{tab_padding};border-top-left-radius:{radius}px;border-top-right-radius:{radius}px;margin-right:{tab_margin}px;{touch_font}}}"
+    "QTabBar::tab:selected{{background-color:white;color:{accent};font-weight:{tab_weight};}}"
+    "QGroupBox{{font-weight:{group_weight};border:1px solid {border};border-radius:{radius}px;margin-top:{group_margin}px;padding-top:{group_padding}px;{touch_font}}}"
+    "QGroupBox::title{{subcontrol-origin:margin;left:{title_left}px;padding:0 {title_padding}px 0 {title_padding}px;}}"
+    "QLineEdit,QTextEdit,QComboBox{{border:1px solid {border};border-radius:{input_radius}px;padding:{input_padding};background-color:white;{touch_input}}}"
+    "QLineEdit:focus,QTextEdit:focus,QComboBox:focus{{border-color:{accent};}}"
+    "QProgressBar{{border:1px solid {border};border-radius:{input_radius}px;text-align:center;background-color:{bg};{touch_progress}}}"
+    "QProgressBar::chunk{{background-color:{accent};border-radius:{chunk_radius}px;}}"
+)
+
+# Per-platform values for _TEMPLATE. touch_font_size and touch_min_height
+# are set on touch platforms only, where they enlarge text and controls
+_PALETTES = {
+    "macos": {
+        "bg": "#F5F5F7", "font": "SF Pro Display", "font_size": 13,
+        "border": "#E5E5E7", "accent": "#007AFF",
+        "accent_hover": "#0056CC", "accent_pressed": "#004499",
+        "radius": 8, "menu_bar_padding": "4px",
+        "menu_item_padding": "6px 12px", "menu_item_radius": 6,
+        "button_radius": 8, "button_padding": "8px 16px",
+        "button_weight": "500", "button_min_height": 20,
+        "tab_padding": "8px 16px", "tab_margin": 2, "tab_weight": "500",
+        "group_weight": "600", "group_margin": 12, "group_padding": 8,
+        "title_left": 12, "title_padding": 8,
+        "input_radius": 6, "input_padding": "6px 8px", "chunk_radius": 5,
+        "touch_font_size": None, "touch_min_height": None,
+    },
+    "ios": {
+        "bg": "#F2F2F7", "font": "SF Pro Display", "font_size": 16,
+        "border": "#E5E5E7", "accent": "#007AFF",
+        "accent_hover": "#0056CC", "accent_pressed": "#004499",
+        "radius": 12, "menu_bar_padding": "8px",
+        "menu_item_padding": "8px 16px", "menu_item_radius": 8,
+        "button_radius": 12, "button_padding": "12px 24px",
+        "button_weight": "600", "button_min_height": 44,
+        "tab_padding": "12px 20px", "tab_margin": 4, "tab_weight": "600",
+        "group_weight": "600", "group_margin": 16, "group_padding": 12,
+        "title_left": 16, "title_padding": 12,
+        "input_radius": 8, "input_padding": "12px 16px", "chunk_radius": 6,
+        "touch_font_size": 16, "touch_min_height": 44,
+    },
+    "windows": {
+        "bg": "#F3F3F3", "font": "Segoe UI", "font_size": 9,
+        "border": "#D4D4D4", "accent": "#0078D4",
+        "accent_hover": "#106EBE", "accent_pressed": "#005A9E",
+        "radius": 4, "menu_bar_padding": "2px",
+        "menu_item_padding": "4px 8px", "menu_item_radius": 3,
+        "button_radius": 4, "button_padding": "6px 12px",
+        "button_weight": "normal", "button_min_height": 16,
+        "tab_padding": "6px 12px", "tab_margin": 1, "tab_weight": "normal",
+        "group_weight": "normal", "group_margin": 8, "group_padding": 6,
+        "title_left": 8, "title_padding": 6,
+        "input_radius": 3, "input_padding": "4px 6px", "chunk_radius": 2,
+        "touch_font_size": None, "touch_min_height": None,
+    },
+    "android": {
+        "bg": "#FAFAFA", "font": "Roboto", "font_size": 14,
+        "border": "#E0E0E0", "accent": "#6200EE",
+        "accent_hover": "#3700B3", "accent_pressed": "#30009C",
+        "radius": 8, "menu_bar_padding": "8px",
+        "menu_item_padding": "8px 16px", "menu_item_radius": 8,
+        "button_radius": 8, "button_padding": "12px 24px",
+        "button_weight": "500", "button_min_height": 48,
+        "tab_padding": "10px 18px", "tab_margin": 2, "tab_weight": "500",
+        "group_weight": "500", "group_margin": 12, "group_padding": 10,
+        "title_left": 12, "title_padding": 10,
+        "input_radius": 6, "input_padding": "10px 14px", "chunk_radius": 5,
+        "touch_font_size": 14, "touch_min_height": 48,
+    },
+    "default": {
+        "bg": "#F5F5F5", "font": "Arial", "font_size": 12,
+        "border": "#CCCCCC", "accent": "#007AFF",
+        "accent_hover": "#0056CC", "accent_pressed": "#004499",
+        "radius": 6, "menu_bar_padding": "4px",
+        "menu_item_padding": "6px 12px", "menu_item_radius": 4,
+        "button_radius": 6, "button_padding": "8px 16px",
+        "button_weight": "normal", "button_min_height": 20,
+        "tab_padding": "8px 16px", "tab_margin": 2, "tab_weight": "normal",
+        "group_weight": "normal", "group_margin": 10, "group_padding": 8,
+        "title_left": 10, "title_padding": 8,
+        "input_radius": 4, "input_padding": "6px 8px", "chunk_radius": 3,
+        "touch_font_size": None, "touch_min_height": None,
+    },
+}
+
+# Platforms share most colors, so share the string objects too
+_PALETTES = {
+    name: {key: sys.intern(value) if isinstance(value, str) else value
+           for key, value in palette.items()}
+    for name, palette in _PALETTES.items()
+}
+
+
+def _format_style(palette: Mapping[str, Any]) -> str:
+    """Fill _TEMPLATE from a palette."""
+    touch_font = touch_input = touch_progress = ""
+    if palette["touch_font_size"] is not None:
+        touch_font = f"font-size:{palette['touch_font_size']}px;"
+        touch_input = f"{touch_font}min-height:{palette['touch_min_height']}px;"
+        touch_progress = "min-height:8px;"
+    return _TEMPLATE.format(touch_font=touch_font, touch_input=touch_input,
+                            touch_progress=touch_progress, disabled_bg=_DISABLED_BG,
+                            secondary_text=_SECONDARY_TEXT, **palette)
+
+
+# Formatted stylesheets, keyed like _PALETTES. Only the platform the app
+# runs on is ever requested, so each is built on first use
+_STYLE_CACHE: Dict[str, str] = {}
+
+
+def _get_style(name: str) -> str:
+    """Get the stylesheet for a _PALETTES entry, formatting it on first use."""
+    style = _STYLE_CACHE.get(name)
+    if style is None:
+        style = _STYLE_CACHE[name] = _format_style(_PALETTES[name])
+    return style
+
+
+class MobileOpts(NamedTuple):
+    """Layout settings for touch or pointer interfaces."""
+    touch_target_size: int  # Minimum touch target size in pixels
+    spacing: int
+    font_size_multiplier: float
+    button_height: int
+    scroll_speed: float
+    gesture_enabled: bool
+    safe_area_margin: int
+
+
+class DpiSettings(NamedTuple):
+    """Sizing settings for the display density."""
+    scale_factor: float  # Qt handles the actual scaling
+    icon_size: int
+    font_size_adjustment: int
+    border_width: int
+    shadow_blur: int
+
+
+# Shared by every caller; tuples, so they can't be changed under them
+_MOBILE_OPTS = MobileOpts(
+    touch_target_size=44,
+    spacing=16,  # Increased spacing for touch interfaces
+    font_size_multiplier=1.2,  # Larger fonts for mobile
+    button_height=48,  # Taller buttons for touch
+    scroll_speed=1.5,  # Faster scrolling for touch
+    gesture_enabled=True,
+    safe_area_margin=20,
+)
+
+_DESKTOP_OPTS = MobileOpts(
+    touch_target_size=20,
+    spacing=8,
+    font_size_multiplier=1.0,
+    button_height=32,
+    scroll_speed=1.0,
+    gesture_enabled=False,
+    safe_area_margin=0,
+)
+
+_HIGH_DPI_SETTINGS = DpiSettings(
+    scale_factor=1.0,
+    icon_size=24,
+    font_size_adjustment=0,
+    border_width=1,
+    shadow_blur=10,
+)
+
+_STANDARD_DPI_SETTINGS = DpiSettings(
+    scale_factor=1.0,
+    icon_size=16,
+    font_size_adjustment=0,
+    border_width=1,
+    shadow_blur=5,
+)
+
+
+@lru_cache(maxsize=1)
+def get_main_window_style() -> str:
+    """Get platform-specific main window stylesheet."""
+    # Imported on first use so importing this module stays cheap
+    from ..platform_utils import PlatformUtils
+    config = PlatformUtils.get_platform_config()
+    ui_style = config.get("ui_style", "default")
+    return _get_style(ui_style if ui_style in _PALETTES else "default")
+
+
+def get_mobile_optimizations() -> MobileOpts:
+    """Get mobile-specific optimizations."""
+    from ..platform_utils import PlatformUtils
+    return _MOBILE_OPTS if PlatformUtils.is_mobile() else _DESKTOP_OPTS
+
+
+def get_high_dpi_settings() -> DpiSettings:
+    """Get high DPI display settings."""
+    from ..platform_utils import PlatformUtils
+    return _HIGH_DPI_SETTINGS if PlatformUtils.is_high_dpi() else _STANDARD_DPI_SETTINGS
 
 
 class PlatformStyles:
-    """Platform-specific stylesheet generator."""
+    """Platform-specific stylesheet generator.
     
-    @staticmethod
-    def get_main_window_style() -> str:
-        """Get platform-specific main window stylesheet."""
-        config = PlatformUtils.get_platform_config()
-        ui_style = config.get("ui_style", "default")
-        
-        if ui_style == "macos":
-            return PlatformStyles._get_macos_style()
-        elif ui_style == "ios":
-            return PlatformStyles._get_ios_style()
-        elif ui_style == "windows":
-            return PlatformStyles._get_windows_style()
-        elif ui_style == "android":
-            return PlatformStyles._get_android_style()
-        else:
-            return PlatformStyles._get_default_style()
+    Kept for existing callers; the module-level functions are the same
+    getters without the class lookup.
+    """
+    
+    get_main_window_style = staticmethod(get_main_window_style)
+    get_mobile_optimizations = staticmethod(get_mobile_optimizations)
+    get_high_dpi_settings = staticmethod(get_high_dpi_settings)
     
     @staticmethod
     def _get_macos_style() -> str:
         """Get macOS-specific stylesheet."""
-        return """
-        QMainWindow {
-            background-color: #F5F5F7;
-            color: #000000;
-            font-family: "SF Pro Display";
-            font-size: 13px;
-        }
-        
-        QMenuBar {
-            background-color: #F5F5F7;
-            border-bottom: 1px solid #E5E5E7;
-            padding: 4px;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 6px 12px;
-            border-radius: 6px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #007AFF;
-            color: white;
-        }
-        
-        QPushButton {
-            background-color: #007AFF;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 8px 16px;
-            font-weight: 500;
-            min-height: 20px;
-        }
-        
-        QPushButton:hover {
-            background-color: #0056CC;
-        }
-        
-        QPushButton:pressed {
-            background-color: #004499;
-        }
-        
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #E5E5E7;
-            border-radius: 8px;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #F5F5F7;
-            color: #666666;
-            padding: 8px 16px;
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-            margin-right: 2px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            color: #007AFF;
-            font-weight: 500;
-        }
-        
-        QGroupBox {
-            font-weight: 600;
-            border: 1px solid #E5E5E7;
-            border-radius: 8px;
-            margin-top: 12px;
-            padding-top: 8px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 12px;
-            padding: 0 8px 0 8px;
-        }
-        
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #E5E5E7;
-            border-radius: 6px;
-            padding: 6px 8px;
-            background-color: white;
-        }
-        
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-            border-color: #007AFF;
-        }
-        
-        QProgressBar {
-            border: 1px solid #E5E5E7;
-            border-radius: 6px;
-            text-align: center;
-            background-color: #F5F5F7;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #007AFF;
-            border-radius: 5px;
-        }
-        """
+        return _get_style("macos")
     
     @staticmethod
     def _get_ios_style() -> str:
         """Get iOS-specific stylesheet."""
-        return """
-        QMainWindow {
-            background-color: #F2F2F7;
-            color: #000000;
-            font-family: "SF Pro Display";
-            font-size: 16px;
-        }
-        
-        QMenuBar {
-            background-color: #F2F2F7;
-            border-bottom: 1px solid #E5E5E7;
-            padding: 8px;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 8px 16px;
-            border-radius: 8px;
-            font-size: 16px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #007AFF;
-            color: white;
-        }
-        
-        QPushButton {
-            background-color: #007AFF;
-            color: white;
-            border: none;
-            border-radius: 12px;
-            padding: 12px 24px;
-            font-weight: 600;
-            font-size: 16px;
-            min-height: 44px;
-        }
-        
-        QPushButton:hover {
-            background-color: #0056CC;
-        }
-        
-        QPushButton:pressed {
-            background-color: #004499;
-        }
-        
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #E5E5E7;
-            border-radius: 12px;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #F2F2F7;
-            color: #666666;
-            padding: 12px 20px;
-            border-top-left-radius: 12px;
-            border-top-right-radius: 12px;
-            margin-right: 4px;
-            font-size: 16px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            color: #007AFF;
-            font-weight: 600;
-        }
-        
-        QGroupBox {
-            font-weight: 600;
-            border: 1px solid #E5E5E7;
-            border-radius: 12px;
-            margin-top: 16px;
-            padding-top: 12px;
-            font-size: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 16px;
-            padding: 0 12px 0 12px;
-        }
-        
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #E5E5E7;
-            border-radius: 8px;
-            padding: 12px 16px;
-            background-color: white;
-            font-size: 16px;
-            min-height: 44px;
-        }
-        
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-            border-color: #007AFF;
-        }
-        
-        QProgressBar {
-            border: 1px solid #E5E5E7;
-            border-radius: 8px;
-            text-align: center;
-            background-color: #F2F2F7;
-            min-height: 8px;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #007AFF;
-            border-radius: 6px;
-        }
-        """
+        return _get_style("ios")
     
     @staticmethod
     def _get_windows_style() -> str:
         """Get Windows-specific stylesheet."""
-        return """
-        QMainWindow {
-            background-color: #F3F3F3;
-            color: #000000;
-            font-family: "Segoe UI";
-            font-size: 9px;
-        }
-        
-        QMenuBar {
-            background-color: #F3F3F3;
-            border-bottom: 1px solid #D4D4D4;
-            padding: 2px;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 4px 8px;
-            border-radius: 3px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #0078D4;
-            color: white;
-        }
-        
-        QPushButton {
-            background-color: #0078D4;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 6px 12px;
-            font-weight: normal;
-            min-height: 16px;
-        }
-        
-        QPushButton:hover {
-            background-color: #106EBE;
-        }
-        
-        QPushButton:pressed {
-            background-color: #005A9E;
-        }
-        
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #D4D4D4;
-            border-radius: 4px;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #F3F3F3;
-            color: #666666;
-            padding: 6px 12px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-            margin-right: 1px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            color: #0078D4;
-            font-weight: normal;
-        }
-        
-        QGroupBox {
-            font-weight: normal;
-            border: 1px solid #D4D4D4;
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 6px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 8px;
-            padding: 0 6px 0 6px;
-        }
-        
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #D4D4D4;
-            border-radius: 3px;
-            padding: 4px 6px;
-            background-color: white;
-        }
-        
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-            border-color: #0078D4;
-        }
-        
-        QProgressBar {
-            border: 1px solid #D4D4D4;
-            border-radius: 3px;
-            text-align: center;
-            background-color: #F3F3F3;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #0078D4;
-            border-radius: 2px;
-        }
-        """
+        return _get_style("windows")
     
     @staticmethod
     def _get_android_style() -> str:
         """Get Android-specific stylesheet."""
-        return """
-        QMainWindow {
-            background-color: #FAFAFA;
-            color: #000000;
-            font-family: "Roboto";
-            font-size: 14px;
-        }
-        
-        QMenuBar {
-            background-color: #FAFAFA;
-            border-bottom: 1px solid #E0E0E0;
-            padding: 8px;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 8px 16px;
-            border-radius: 8px;
-            font-size: 14px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #6200EE;
-            color: white;
-        }
-        
-        QPushButton {
-            background-color: #6200EE;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 12px 24px;
-            font-weight: 500;
-            font-size: 14px;
-            min-height: 48px;
-        }
-        
-        QPushButton:hover {
-            background-color: #3700B3;
-        }
-        
-        QPushButton:pressed {
-            background-color: #30009C;
-        }
-        
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #E0E0E0;
-            border-radius: 8px;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #FAFAFA;
-            color: #666666;
-            padding: 10px 18px;
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-            margin-right: 2px;
-            font-size: 14px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            color: #6200EE;
-            font-weight: 500;
-        }
-        
-        QGroupBox {
-            font-weight: 500;
-            border: 1px solid #E0E0E0;
-            border-radius: 8px;
-            margin-top: 12px;
-            padding-top: 10px;
-            font-size: 14px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 12px;
-            padding: 0 10px 0 10px;
-        }
-        
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #E0E0E0;
-            border-radius: 6px;
-            padding: 10px 14px;
-            background-color: white;
-            font-size: 14px;
-            min-height: 48px;
-        }
-        
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-            border-color: #6200EE;
-        }
-        
-        QProgressBar {
-            border: 1px solid #E0E0E0;
-            border-radius: 6px;
-            text-align: center;
-            background-color: #FAFAFA;
-            min-height: 8px;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #6200EE;
-            border-radius: 5px;
-        }
-        """
+        return _get_style("android")
     
     @staticmethod
     def _get_default_style() -> str:
         """Get default stylesheet for unsupported platforms."""
-        return """
-        QMainWindow {
-            background-color: #F5F5F5;
-            color: #000000;
-            font-family: "Arial";
-            font-size: 12px;
-        }
-        
-        QMenuBar {
-            background-color: #F5F5F5;
-            border-bottom: 1px solid #CCCCCC;
-            padding: 4px;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 6px 12px;
-            border-radius: 4px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #007AFF;
-            color: white;
-        }
-        
-        QPushButton {
-            background-color: #007AFF;
-            color: white;
-            border: none;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-weight: normal;
-            min-height: 20px;
-        }
-        
-        QPushButton:hover {
-            background-color: #0056CC;
-        }
-        
-        QPushButton:pressed {
-            background-color: #004499;
-        }
-        
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #CCCCCC;
-            border-radius: 6px;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #F5F5F5;
-            color: #666666;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-            margin-right: 2px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            color: #007AFF;
-            font-weight: normal;
-        }
-        
-        QGroupBox {
-            font-weight: normal;
-            border: 1px solid #CCCCCC;
-            border-radius: 6px;
-            margin-top: 10px;
-            padding-top: 8px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 8px 0 8px;
-        }
-        
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #CCCCCC;
-            border-radius: 4px;
-            padding: 6px 8px;
-            background-color: white;
-        }
-        
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-            border-color: #007AFF;
-        }
-        
-        QProgressBar {
-            border: 1px solid #CCCCCC;
-            border-radius: 4px;
-            text-align: center;
-            background-color: #F5F5F5;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #007AFF;
-            border-radius: 3px;
-        }
-        """
-    
-    @staticmethod
-    def get_mobile_optimizations() -> Dict[str, Any]:
-        """Get mobile-specific optimizations."""
-        if PlatformUtils.is_mobile():
-            return {
-                "touch_target_size": 44,  # Minimum touch target size in pixels
-                "spacing": 16,  # Increased spacing for touch interfaces
-                "font_size_multiplier": 1.2,  # Larger fonts for mobile
-                "button_height": 48,  # Taller buttons for touch
-                "scroll_speed": 1.5,  # Faster scrolling for touch
-                "gesture_enabled": True,
-                "safe_area_margin": 20
-            }
-        else:
-            return {
-                "touch_target_size": 20,
-                "spacing": 8,
-                "font_size_multiplier": 1.0,
-                "button_height": 32,
-                "scroll_speed": 1.0,
-                "gesture_enabled": False,
-                "safe_area_margin": 0
-            }
-    
-    @staticmethod
-    def get_high_dpi_settings() -> Dict[str, Any]:
-        """Get high DPI display settings."""
-        if PlatformUtils.is_high_dpi():
-            return {
-                "scale_factor": 1.0,  # Let Qt handle scaling
-                "icon_size": 24,
-                "font_size_adjustment": 0,
-                "border_width": 1,
-                "shadow_blur": 10
-            }
-        else:
-            return {
-                "scale_factor": 1.0,
-                "icon_size": 16,
-                "font_size_adjustment": 0,
-                "border_width": 1,
-                "shadow_blur": 5
-            }
+        return _get_style("default")